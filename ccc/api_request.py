@@ -115,6 +115,15 @@ class ApiRequest:
         self.last_executed = datetime.now(timezone.utc)
 
 
+# Status class (code // 100) -> (color, symbol); anything else is shown as an error
+_STATUS_CLASS_STYLES = {
+    2: ("green", "✓"),
+    3: ("yellow", "→"),
+    4: ("orange", "⚠"),
+}
+_OTHER_STATUS_STYLE = ("red", "✗")
+
+
 @dataclass
 class ApiResponse:
     """
@@ -167,14 +176,7 @@ class ApiResponse:
         Returns:
             Color string: "green" (2xx), "yellow" (3xx), "orange" (4xx), "red" (5xx)
         """
-        if 200 <= self.status_code < 300:
-            return "green"
-        elif 300 <= self.status_code < 400:
-            return "yellow"
-        elif 400 <= self.status_code < 500:
-            return "orange"
-        else:  # 500+
-            return "red"
+        return _STATUS_CLASS_STYLES.get(self.status_code // 100, _OTHER_STATUS_STYLE)[0]
 
     def status_symbol(self) -> str:
         """
@@ -183,14 +185,7 @@ class ApiResponse:
         Returns:
             Symbol: "✓" (2xx), "→" (3xx), "⚠" (4xx), "✗" (5xx)
         """
-        if 200 <= self.status_code < 300:
-            return "✓"
-        elif 300 <= self.status_code < 400:
-            return "→"
-        elif 400 <= self.status_code < 500:
-            return "⚠"
-        else:  # 500+
-            return "✗"
+        return _STATUS_CLASS_STYLES.get(self.status_code // 100, _OTHER_STATUS_STYLE)[1]
 
     def matches_expected(self, expected: Optional[int]) -> bool:
         """
@@ -7,7 +7,7 @@ Handles storage, execution, and management of API requests.
 import yaml
 import requests
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime, timezone
 
 from ccc.api_request import (
@@ -17,7 +17,7 @@ from ccc.api_request import (
     VariableStore,
     HttpMethod,
 )
-from ccc.utils import get_ccc_home
+from ccc.utils import get_ccc_home, parse_iso_datetime
 
 
 def get_api_requests_path(branch_name: str) -> Path:
@@ -153,6 +153,58 @@ def load_history(branch_name: str, limit: Optional[int] = None) -> List[ApiReque
         return []
 
 
+def load_last_execution_map(
+    branch_name: str,
+    request_names: Optional[Iterable[str]] = None,
+) -> Dict[str, ApiRequestExecution]:
+    """
+    Load the most recent execution of each request from history.
+
+    Only the winning entries are turned into ApiRequestExecution objects, so
+    older executions (and their response bodies) are never materialized.
+    Malformed entries are skipped individually.
+
+    Args:
+        branch_name: Branch name
+        request_names: Only look up these requests (None for all)
+
+    Returns:
+        Dictionary mapping request name to its latest ApiRequestExecution
+    """
+    ensure_api_files(branch_name)
+    path = get_api_history_path(branch_name)
+    wanted = set(request_names) if request_names is not None else None
+
+    try:
+        with open(path, 'r') as f:
+            data = yaml.safe_load(f) or {}
+        history_data = data.get("history") or []
+    except Exception:
+        return {}
+
+    # request name -> (timestamp, raw entry) of the newest execution seen
+    latest: Dict[str, Tuple[datetime, Dict[str, Any]]] = {}
+    for exec_data in history_data:
+        try:
+            name = exec_data["request_name"]
+            if wanted is not None and name not in wanted:
+                continue
+            timestamp = parse_iso_datetime(exec_data["timestamp"])
+            current = latest.get(name)
+            if current is None or timestamp > current[0]:
+                latest[name] = (timestamp, exec_data)
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    last_by_name: Dict[str, ApiRequestExecution] = {}
+    for name, (_, exec_data) in latest.items():
+        try:
+            last_by_name[name] = ApiRequestExecution.from_dict(exec_data)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return last_by_name
+
+
 def save_history(branch_name: str, history: List[ApiRequestExecution], max_entries: int = 50):
     """
     Save request execution history for a branch.
@@ -301,7 +301,8 @@ User: {user_message}"""
                 f"Test Status: {test_status.passed}/{test_status.total} passing ({test_status.status})"
             )
             if test_status.failures:
-                context_parts.append(f"  Failures: {len(test_status.failures)}")
+                failure_count = len(test_status.failures) + test_status.truncated_failure_count
+                context_parts.append(f"  Failures: {failure_count}")
             context_parts.append("")
 
         # Add instruction
@@ -1283,7 +1283,7 @@ def todo_list_cmd(branch_name: str, all: bool):
 
     # Display progress
     stats = todo_list.progress_stats()
-    progress = todo_list.progress_percentage()
+    progress = todo_list.progress_percentage(stats)
     console.print(
         f"\n[bold]Progress:[/bold] {stats['done']}/{stats['total']} complete ({progress:.0f}%)"
     )
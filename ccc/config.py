@@ -51,6 +51,10 @@ class Config:
     database_connection_string: Optional[str] = None  # e.g., "postgresql://localhost:5432/mydb"
     database_health_check_interval: int = 30  # Health check interval in seconds
 
+    # Status bar file writes are coalesced to at most one per interval
+    status_flush_interval_ms: int = 100
+    status_fsync: bool = False  # fsync status file writes (not needed for a cache)
+
     # Phase 3: Build and test commands
     # Global default commands (used if no project-specific override)
     default_build_command: str = "npm run build"
@@ -291,6 +295,10 @@ def load_config() -> Config:
             database_health_check_interval=data.get(
                 "database_health_check_interval", Config.database_health_check_interval
             ),
+            status_flush_interval_ms=data.get(
+                "status_flush_interval_ms", Config.status_flush_interval_ms
+            ),
+            status_fsync=data.get("status_fsync", Config.status_fsync),
             default_build_command=data.get(
                 "default_build_command", Config.default_build_command
             ),
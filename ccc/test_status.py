@@ -2,17 +2,44 @@
 Test status tracking for tickets.
 """
 
-import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict, field
-
-from ccc.utils import get_branch_dir, print_warning, print_error, format_time_ago
-
-
-@dataclass
+from dataclasses import dataclass, field
+
+from ccc.utils import (
+    DATACLASS_SLOTS,
+    get_branch_dir,
+    print_warning,
+    print_error,
+    format_time_ago,
+    json_dumps,
+    json_loads,
+    parse_iso_datetime,
+)
+
+# Failures kept in test-status.json; the rest are only counted
+MAX_STORED_FAILURES = 200
+
+# Summary line patterns for supported test frameworks
+# Jest example: "Tests: 2 failed, 47 passed, 1 skipped, 50 total"
+_JEST_RE = re.compile(
+    r"Tests:\s+(?:(\d+)\s+failed,?\s*)?(?:(\d+)\s+passed,?\s*)?(?:(\d+)\s+skipped,?\s*)?(\d+)\s+total"
+)
+# Pytest example: "2 failed, 47 passed, 1 skipped in 12.34s" (counts in any order)
+_PYTEST_PASSED_RE = re.compile(r"(\d+)\s+passed")
+_PYTEST_FAILED_RE = re.compile(r"(\d+)\s+failed")
+_PYTEST_SKIPPED_RE = re.compile(r"(\d+)\s+skipped")
+_PYTEST_COUNT_RE = re.compile(r"\d+\s+(?:passed|failed|skipped)")
+_PYTEST_SUMMARY_TAIL = 512  # Characters at the end of the output holding the summary
+# Tokens used to auto-detect the framework in a single scan; framework
+# names are matched case-insensitively, summary markers exactly
+_AUTODETECT_RE = re.compile(r"(?i:jest|pytest)|Tests:|passed,|PASS|FAIL|ok  ")
+_GO_MARKERS = frozenset(("PASS", "FAIL", "ok  "))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TestFailure:
     """Represents a test failure."""
 
@@ -22,14 +49,19 @@ class TestFailure:
     line: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "message": self.message,
+            "file": self.file,
+            "line": self.line,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TestFailure":
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestStatus:
     """Represents the test status of a branch."""
 
@@ -42,29 +74,36 @@ class TestStatus:
     failed: int = 0
     skipped: int = 0
     failures: List[TestFailure] = field(default_factory=list)
+    truncated_failure_count: int = 0  # Failures dropped beyond MAX_STORED_FAILURES
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        if self.last_run:
-            data["last_run"] = self.last_run.isoformat()
-        data["failures"] = [f.to_dict() for f in self.failures]
-        return data
+        return {
+            "branch_name": self.branch_name,
+            "status": self.status,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "duration_seconds": self.duration_seconds,
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "failures": [f.to_dict() for f in self.failures],
+            "truncated_failure_count": self.truncated_failure_count,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TestStatus":
         """Create from dictionary (loaded from JSON)."""
         if isinstance(data.get("last_run"), str):
-            data["last_run"] = datetime.fromisoformat(data["last_run"])
-
-        # Handle failures
-        if "failures" in data:
-            data["failures"] = [
-                TestFailure.from_dict(f) if isinstance(f, dict) else f
-                for f in data["failures"]
-            ]
+            data["last_run"] = parse_iso_datetime(data["last_run"])
+
+        # Handle failures; loaded JSON is all dicts, so branch once on the
+        # first element instead of type-checking every entry
+        raw = data.get("failures") or []
+        if raw and isinstance(raw[0], dict):
+            data["failures"] = [TestFailure(**f) for f in raw]
         else:
-            data["failures"] = []
+            data["failures"] = list(raw)
 
         return cls(**data)
 
@@ -86,15 +125,13 @@ def read_test_status(branch_name: str) -> Optional[TestStatus]:
     """
     status_file = get_test_status_path(branch_name)
 
-    if not status_file.exists():
-        return None
-
     try:
-        with open(status_file, "r") as f:
-            data = json.load(f)
-
+        data = json_loads(status_file.read_bytes())
         return TestStatus.from_dict(data)
 
+    except FileNotFoundError:
+        return None
+
     except Exception as e:
         print_warning(f"Error reading test status for {branch_name}: {e}")
         return None
@@ -120,8 +157,8 @@ def write_test_status(status: TestStatus) -> bool:
         if status.last_run is None:
             status.last_run = datetime.now(timezone.utc)
 
-        with open(status_file, "w") as f:
-            json.dump(status.to_dict(), f, indent=2)
+        with open(status_file, "wb") as f:
+            f.write(json_dumps(status.to_dict()))
 
         return True
 
@@ -153,6 +190,7 @@ def update_test_status(
     failed: Optional[int] = None,
     skipped: Optional[int] = None,
     failures: Optional[List[TestFailure]] = None,
+    max_stored_failures: int = MAX_STORED_FAILURES,
 ) -> bool:
     """
     Update test status (helper function for CLI).
@@ -166,6 +204,7 @@ def update_test_status(
         failed: Number of failed tests
         skipped: Number of skipped tests
         failures: List of test failures
+        max_stored_failures: Cap on failures written to the status file
 
     Returns:
         True if successful, False otherwise
@@ -196,7 +235,8 @@ def update_test_status(
         test_status.skipped = skipped
 
     if failures is not None:
-        test_status.failures = failures
+        test_status.failures = failures[:max_stored_failures]
+        test_status.truncated_failure_count = max(len(failures) - max_stored_failures, 0)
 
     return write_test_status(test_status)
 
@@ -213,13 +253,7 @@ def parse_test_output(output: str, framework: str = "auto") -> Dict[str, Any]:
         Dictionary with parsed test results
     """
     if framework == "auto":
-        # Auto-detect framework
-        if "jest" in output.lower() or "Tests:" in output:
-            framework = "jest"
-        elif "pytest" in output.lower() or "passed," in output:
-            framework = "pytest"
-        elif "PASS" in output and "FAIL" in output and "ok  " in output:
-            framework = "go"
+        framework = _detect_framework(output)
 
     if framework == "jest":
         return _parse_jest_output(output)
@@ -237,11 +271,36 @@ def parse_test_output(output: str, framework: str = "auto") -> Dict[str, Any]:
         }
 
 
+def _detect_framework(output: str) -> str:
+    """
+    Detect the test framework from its output in one pass.
+
+    Jest markers win as soon as they are seen; pytest is preferred over Go,
+    which needs all of its markers present.
+    """
+    seen = set()
+    for match in _AUTODETECT_RE.finditer(output):
+        token = match.group(0)
+        if token == "Tests:":
+            return "jest"
+        lowered = token.lower()
+        if lowered == "jest":
+            return "jest"
+        seen.add(lowered if lowered == "pytest" else token)
+
+    if "pytest" in seen or "passed," in seen:
+        return "pytest"
+    if _GO_MARKERS <= seen:
+        return "go"
+    return "auto"
+
+
 def _parse_jest_output(output: str) -> Dict[str, Any]:
     """Parse Jest test output."""
-    # Example: "Tests: 2 failed, 47 passed, 1 skipped, 50 total"
-    pattern = r"Tests:\s+(?:(\d+)\s+failed,?\s*)?(?:(\d+)\s+passed,?\s*)?(?:(\d+)\s+skipped,?\s*)?(\d+)\s+total"
-    match = re.search(pattern, output)
+    # The summary is near the end; anchor the regex at the last "Tests:"
+    # rather than letting it try every position in a long log
+    idx = output.rfind("Tests:")
+    match = _JEST_RE.match(output, idx) if idx >= 0 else None
 
     if match:
         failed = int(match.group(1)) if match.group(1) else 0
@@ -261,34 +320,42 @@ def _parse_jest_output(output: str) -> Dict[str, Any]:
 
 def _parse_pytest_output(output: str) -> Dict[str, Any]:
     """Parse pytest test output."""
-    # Example: "47 passed, 2 failed, 1 skipped in 12.34s"
-    # Pattern requires at least one of passed/failed/skipped with their numbers
-    pattern = r"(\d+)\s+passed(?:,\s*(\d+)\s+failed)?(?:,\s*(\d+)\s+skipped)?|(\d+)\s+failed(?:,\s*(\d+)\s+skipped)?|(\d+)\s+skipped"
-    match = re.search(pattern, output)
-
-    if match:
-        # Handle different match groups depending on what was found
-        groups = match.groups()
-        passed = int(groups[0]) if groups[0] else (0)
-        failed = int(groups[1]) if groups[1] else (int(groups[3]) if groups[3] else 0)
-        skipped = int(groups[2]) if groups[2] else (int(groups[4]) if groups[4] else (int(groups[5]) if groups[5] else 0))
-        total = passed + failed + skipped
-
-        return {
-            "total": total,
-            "passed": passed,
-            "failed": failed,
-            "skipped": skipped,
-        }
+    # The summary line is normally at the end of the run, so only scan the
+    # tail; each count is matched independently so their order doesn't matter
+    tail = output
+    if len(output) > _PYTEST_SUMMARY_TAIL:
+        # Start the window at a line boundary so a count like "1234 passed"
+        # is never cut down to "34 passed"
+        tail = output[-_PYTEST_SUMMARY_TAIL:]
+        tail = tail[tail.find("\n") + 1:] if "\n" in tail else ""
+
+        # Wrapper output (tox, make, npm) after the summary can push it out
+        # of the window; start from the last line with a count instead
+        if not _PYTEST_COUNT_RE.search(tail):
+            pos = max(output.rfind(" passed"), output.rfind(" failed"), output.rfind(" skipped"))
+            tail = output[output.rfind("\n", 0, pos) + 1:] if pos >= 0 else ""
+
+    passed_match = _PYTEST_PASSED_RE.search(tail)
+    failed_match = _PYTEST_FAILED_RE.search(tail)
+    skipped_match = _PYTEST_SKIPPED_RE.search(tail)
+
+    passed = int(passed_match.group(1)) if passed_match else 0
+    failed = int(failed_match.group(1)) if failed_match else 0
+    skipped = int(skipped_match.group(1)) if skipped_match else 0
 
-    return {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+    return {
+        "total": passed + failed + skipped,
+        "passed": passed,
+        "failed": failed,
+        "skipped": skipped,
+    }
 
 
 def _parse_go_output(output: str) -> Dict[str, Any]:
     """Parse Go test output."""
-    # Count individual test results (--- PASS: and --- FAIL:)
-    passed = len(re.findall(r"^---\s+PASS:", output, re.MULTILINE))
-    failed = len(re.findall(r"^---\s+FAIL:", output, re.MULTILINE))
+    # Count individual test results (--- PASS: and --- FAIL: at line start)
+    passed = output.count("\n--- PASS:") + output.startswith("--- PASS:")
+    failed = output.count("\n--- FAIL:") + output.startswith("--- FAIL:")
     total = passed + failed
 
     return {
@@ -338,7 +405,8 @@ def format_test_status(status: TestStatus) -> str:
                 if failure.line:
                     location += f":{failure.line}"
                 lines.append(f"    {location}")
-        if len(status.failures) > 5:
-            lines.append(f"  ... and {len(status.failures) - 5} more")
+        remaining = len(status.failures) - 5 + status.truncated_failure_count
+        if remaining > 0:
+            lines.append(f"  ... and {remaining} more")
 
     return '\n'.join(lines)
@@ -2,21 +2,27 @@
 Ticket data structures and persistence
 """
 
-import yaml
+import copy
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict, field
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field
 
 from ccc.utils import (
+    DATACLASS_SLOTS,
+    atomic_write_bytes,
     get_ccc_home,
     get_tmux_session_name_from_branch,
     extract_display_id,
+    json_dumps,
+    json_loads,
+    parse_iso_datetime,
     print_error,
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Ticket:
     """Represents a development ticket tracked by Command Center."""
 
@@ -56,21 +62,25 @@ class Ticket:
         return extract_display_id(self.branch)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert ticket to dictionary for YAML serialization."""
-        data = asdict(self)
-        # Convert datetimes to ISO format strings
-        data["created_at"] = self.created_at.isoformat()
-        data["updated_at"] = self.updated_at.isoformat()
-        return data
+        """Convert ticket to dictionary for JSON serialization."""
+        return {
+            "branch": self.branch,
+            "title": self.title,
+            "worktree_path": self.worktree_path,
+            "tmux_session": self.tmux_session,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Ticket":
-        """Create ticket from dictionary (loaded from YAML)."""
+        """Create ticket from dictionary (loaded from JSON)."""
         # Parse datetime strings
         if isinstance(data.get("created_at"), str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
+            data["created_at"] = parse_iso_datetime(data["created_at"])
         if isinstance(data.get("updated_at"), str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+            data["updated_at"] = parse_iso_datetime(data["updated_at"])
 
         return cls(**data)
 
@@ -83,26 +93,96 @@ class TicketRegistry:
     """Manages the registry of all tickets."""
 
     def __init__(self):
-        self.registry_path = get_ccc_home() / "tickets.yaml"
+        ccc_home = get_ccc_home()
+        self.registry_path = ccc_home / "tickets.json"
 
-    def load(self) -> List[Ticket]:
-        """Load all tickets from the registry."""
-        if not self.registry_path.exists():
-            return []
+        # Registries written before the switch to JSON; read until the next save
+        self.legacy_registry_path = ccc_home / "tickets.yaml"
+
+        # Parsed tickets, reused while the file's (mtime_ns, size) is unchanged,
+        # plus a branch -> index map over them for constant-time lookups
+        self._cache: List[Ticket] = []
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._by_branch: Dict[str, int] = {}
 
+        # Saves made inside transaction() are held in the cache until it exits
+        self._txn_depth = 0
+        self._txn_dirty = False
+
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        """Get the cache key for the registry file, or None if it is missing."""
         try:
-            with open(self.registry_path, "r") as f:
-                data = yaml.safe_load(f) or {}
+            stat = self.registry_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _set_cache(self, tickets: List[Ticket], key: Optional[Tuple[int, int]]) -> None:
+        """Replace the cached tickets and rebuild the branch index."""
+        self._cache = tickets
+        self._cache_key = key
+        self._by_branch = {t.branch: i for i, t in enumerate(tickets)}
+
+    def _refresh(self) -> List[Ticket]:
+        """Bring the cache up to date with the registry file and return it."""
+        if self._txn_dirty:
+            return self._cache
+
+        key = self._stat_key()
+        if key is not None and key == self._cache_key:
+            return self._cache
 
-            tickets_data = data.get("tickets", [])
-            return [Ticket.from_dict(t) for t in tickets_data]
+        try:
+            self._set_cache([Ticket.from_dict(t) for t in self._load_raw()], key)
 
         except Exception as e:
             print_error(f"Error loading tickets: {e}")
-            return []
+            self._set_cache([], None)
+
+        return self._cache
+
+    def _load_raw(self) -> List[Dict[str, Any]]:
+        """
+        Read ticket dictionaries from the registry without building Tickets.
+
+        Falls back to the pre-JSON YAML registry when no JSON file exists.
+        """
+        try:
+            data = json_loads(self.registry_path.read_bytes()) or {}
+        except FileNotFoundError:
+            if not self.legacy_registry_path.exists():
+                return []
+
+            # Only needed for migration, so keep yaml off the import path
+            import yaml
+
+            # Prefer the libyaml C implementation when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(self.legacy_registry_path, "r") as f:
+                data = yaml.load(f, Loader=loader) or {}
+
+        return data.get("tickets", [])
+
+    def load(self) -> List[Ticket]:
+        """
+        Load all tickets from the registry.
+
+        Callers get copies, so mutating a ticket without saving it never
+        changes what the registry serves.
+        """
+        return [copy.copy(t) for t in self._refresh()]
 
     def save(self, tickets: List[Ticket]) -> None:
         """Save all tickets to the registry."""
+        if self._txn_depth:
+            self._set_cache([copy.copy(t) for t in tickets], self._cache_key)
+            self._txn_dirty = True
+            return
+
+        self._write(tickets)
+
+    def _write(self, tickets: List[Ticket]) -> None:
+        """Atomically write tickets to the registry file."""
         try:
             # Ensure directory exists
             self.registry_path.parent.mkdir(parents=True, exist_ok=True)
@@ -110,31 +190,68 @@ class TicketRegistry:
             # Convert tickets to dictionaries
             data = {"tickets": [t.to_dict() for t in tickets]}
 
-            with open(self.registry_path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            # Write to a temp file in the same directory, then rename over
+            atomic_write_bytes(self.registry_path, json_dumps(data), prefix=".tmp-tickets-")
+
+            # What we just wrote is the new cached state (copied, so the
+            # caller's tickets stay independent of the cache)
+            self._set_cache([copy.copy(t) for t in tickets], self._stat_key())
 
         except Exception as e:
             print_error(f"Error saving tickets: {e}")
             raise
 
+    @contextmanager
+    def transaction(self) -> Iterator["TicketRegistry"]:
+        """
+        Group several changes into a single write.
+
+        Saves inside the block only update the in-memory registry; the file is
+        written once when the outermost transaction exits. If the block raises,
+        the pending changes are discarded.
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._txn_depth -= 1
+            if not self._txn_depth and self._txn_dirty:
+                self._txn_dirty = False
+                self._set_cache([], None)
+            raise
+
+        self._txn_depth -= 1
+        if not self._txn_depth and self._txn_dirty:
+            self._txn_dirty = False
+            self._write(self._cache)
+
     def get(self, branch_name: str) -> Optional[Ticket]:
         """Get a specific ticket by branch name."""
-        tickets = self.load()
-        for ticket in tickets:
-            if ticket.branch == branch_name:
-                return ticket
-        return None
+        tickets = self._refresh()
+        index = self._by_branch.get(branch_name)
+        return copy.copy(tickets[index]) if index is not None else None
+
+    def get_many(self, branch_names: Iterable[str]) -> Dict[str, Ticket]:
+        """Get the tickets for several branches, keyed by branch name."""
+        tickets = self._refresh()
+        by_branch = self._by_branch
+        return {
+            name: copy.copy(tickets[by_branch[name]])
+            for name in branch_names
+            if name in by_branch
+        }
 
     def exists(self, branch_name: str) -> bool:
         """Check if a ticket exists for the given branch."""
-        return self.get(branch_name) is not None
+        self._refresh()
+        return branch_name in self._by_branch
 
     def add(self, ticket: Ticket) -> None:
         """Add a new ticket to the registry."""
         tickets = self.load()
 
         # Check for duplicates
-        if any(t.branch == ticket.branch for t in tickets):
+        if ticket.branch in self._by_branch:
             raise ValueError(f"Ticket for branch '{ticket.branch}' already exists")
 
         tickets.append(ticket)
@@ -145,23 +262,22 @@ class TicketRegistry:
         tickets = self.load()
 
         # Find and replace the ticket
-        updated = False
-        for i, t in enumerate(tickets):
-            if t.branch == ticket.branch:
-                ticket.update_timestamp()
-                tickets[i] = ticket
-                updated = True
-                break
-
-        if not updated:
+        index = self._by_branch.get(ticket.branch)
+        if index is None:
             raise ValueError(f"Ticket for branch '{ticket.branch}' not found")
 
+        ticket.update_timestamp()
+        tickets[index] = ticket
         self.save(tickets)
 
     def delete(self, branch_name: str) -> None:
         """Remove a ticket from the registry by branch name."""
         tickets = self.load()
-        tickets = [t for t in tickets if t.branch != branch_name]
+        index = self._by_branch.get(branch_name)
+        if index is None:
+            return
+
+        del tickets[index]
         self.save(tickets)
 
     def list_all(self) -> List[Ticket]:
@@ -170,11 +286,25 @@ class TicketRegistry:
 
     def list_active(self) -> List[Ticket]:
         """Get all active tickets."""
-        return [t for t in self.load() if t.status == "active"]
+        return self.list_by_status("active")
 
     def list_by_status(self, status: str) -> List[Ticket]:
         """Get tickets by status."""
-        return [t for t in self.load() if t.status == status]
+        # Filter the cache when it is current; otherwise filter the raw
+        # dictionaries so non-matching tickets are never materialized
+        if self._txn_dirty:
+            return [copy.copy(t) for t in self._cache if t.status == status]
+
+        key = self._stat_key()
+        if key is not None and key == self._cache_key:
+            return [copy.copy(t) for t in self._cache if t.status == status]
+
+        try:
+            return [Ticket.from_dict(t) for t in self._load_raw() if t.get("status") == status]
+
+        except Exception as e:
+            print_error(f"Error loading tickets: {e}")
+            return []
 
 
 def create_ticket(
@@ -5,16 +5,33 @@ Provides data structures and operations for managing todo items
 associated with each branch.
 """
 
+import copy
+import io
 import yaml
+from collections import Counter
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
 
-from ccc.utils import get_branch_dir
+from ccc.utils import (
+    DATACLASS_SLOTS,
+    atomic_write_bytes,
+    get_branch_dir,
+    json_dumps,
+    json_loads,
+    parse_iso_datetime,
+)
 
+# Prefer the libyaml C implementations when PyYAML was built with them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@dataclass
+_VALID_STATUSES = frozenset({"not_started", "in_progress", "done", "blocked"})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TodoItem:
     """Represents a single todo item in a branch's task list."""
 
@@ -28,11 +45,26 @@ class TodoItem:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for YAML serialization."""
-        data = asdict(self)
-        if self.completed_at:
+        """
+        Convert to dictionary for YAML serialization.
+
+        Optional fields that are None are left out to keep the file compact;
+        from_dict falls back to the field defaults for missing keys.
+        """
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "description": self.description,
+            "status": self.status,
+        }
+        if self.assigned_agent is not None:
+            data["assigned_agent"] = self.assigned_agent
+        if self.blocked_by is not None:
+            data["blocked_by"] = self.blocked_by
+        if self.completed_at is not None:
             data["completed_at"] = self.completed_at.isoformat()
-        if self.created_at:
+        if self.estimated_minutes is not None:
+            data["estimated_minutes"] = self.estimated_minutes
+        if self.created_at is not None:
             data["created_at"] = self.created_at.isoformat()
         return data
 
@@ -41,83 +73,105 @@ class TodoItem:
         """Create from dictionary loaded from YAML."""
         # Parse datetime strings
         if isinstance(data.get("completed_at"), str):
-            data["completed_at"] = datetime.fromisoformat(data["completed_at"])
+            data["completed_at"] = parse_iso_datetime(data["completed_at"])
         if isinstance(data.get("created_at"), str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
+            data["created_at"] = parse_iso_datetime(data["created_at"])
 
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TodoList:
     """Represents the complete todo list for a branch."""
 
     branch_name: str
     items: List[TodoItem] = field(default_factory=list)
 
-    def progress_percentage(self) -> float:
-        """Calculate completion percentage."""
-        if not self.items:
+    # id -> position in items, and the highest id seen, kept in step with items
+    _id_index: Dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _max_id: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+        self._max_id = max(self._id_index, default=0)
+
+    def _reindex(self, start: int = 0) -> None:
+        """Rebuild the id index for items from position start onward."""
+        items = self.items
+        for i in range(start, len(items)):
+            self._id_index[items[i].id] = i
+
+    def progress_percentage(self, stats: Optional[Dict[str, int]] = None) -> float:
+        """
+        Calculate completion percentage.
+
+        Args:
+            stats: Result of progress_stats() if the caller already has it,
+                to avoid counting the items a second time
+        """
+        if stats is None:
+            stats = self.progress_stats()
+        if not stats["total"]:
             return 0.0
-        done = sum(1 for item in self.items if item.status == "done")
-        return (done / len(self.items)) * 100
+        return (stats["done"] / stats["total"]) * 100
 
     def progress_stats(self) -> Dict[str, int]:
         """Calculate detailed progress statistics."""
-        stats = {
+        counts = Counter(map(attrgetter("status"), self.items))
+        return {
             "total": len(self.items),
-            "done": 0,
-            "in_progress": 0,
-            "not_started": 0,
-            "blocked": 0,
+            "done": counts["done"],
+            "in_progress": counts["in_progress"],
+            "not_started": counts["not_started"],
+            "blocked": counts["blocked"],
         }
 
-        for item in self.items:
-            if item.status in stats:
-                stats[item.status] += 1
-
-        return stats
-
     def next_task_id(self) -> int:
         """Get the next available task ID."""
         if not self.items:
             return 1
-        return max(item.id for item in self.items) + 1
+        return self._max_id + 1
 
     def get_item(self, task_id: int) -> Optional[TodoItem]:
         """Get a todo item by ID."""
-        for item in self.items:
-            if item.id == task_id:
-                return item
-        return None
+        index = self._id_index.get(task_id)
+        return self.items[index] if index is not None else None
 
     def get_item_index(self, task_id: int) -> Optional[int]:
         """Get the index of a todo item by ID."""
-        for i, item in enumerate(self.items):
-            if item.id == task_id:
-                return i
-        return None
+        return self._id_index.get(task_id)
 
     def add_item(self, item: TodoItem) -> None:
         """Add a todo item to the list."""
         # Check for duplicate ID
-        if self.get_item(item.id) is not None:
+        if item.id in self._id_index:
             raise ValueError(f"Todo item with ID {item.id} already exists")
 
+        self._id_index[item.id] = len(self.items)
         self.items.append(item)
+        if item.id > self._max_id:
+            self._max_id = item.id
 
     def delete_item(self, task_id: int) -> bool:
         """Delete a todo item by ID. Returns True if deleted, False if not found."""
-        index = self.get_item_index(task_id)
+        id_index = self._id_index
+        index = id_index.pop(task_id, None)
         if index is None:
             return False
 
-        # Check if any other items are blocked by this one
-        for item in self.items:
+        self.items.pop(index)
+
+        # One pass over the remaining items: clear dependencies on the deleted
+        # task, shift the index for items after it, and find the new max id
+        max_id = 0
+        for i, item in enumerate(self.items):
             if item.blocked_by == task_id:
                 item.blocked_by = None  # Clear the dependency
-
-        self.items.pop(index)
+            if i >= index:
+                id_index[item.id] = i
+            if item.id > max_id:
+                max_id = item.id
+        self._max_id = max_id
         return True
 
     def move_item(self, task_id: int, new_position: int) -> bool:
@@ -143,6 +197,7 @@ class TodoList:
         # Move the item
         item = self.items.pop(current_index)
         self.items.insert(new_index, item)
+        self._reindex(min(current_index, new_index))
         return True
 
     def validate_dependency(self, task_id: int, blocked_by: int) -> bool:
@@ -161,39 +216,78 @@ class TodoList:
             return False
 
         # Check that blocked_by task exists
-        if self.get_item(blocked_by) is None:
+        if blocked_by not in self._id_index:
             return False
 
-        # Check for circular dependencies
-        visited = set()
+        # Check for circular dependencies by following the blocked_by chain
+        index = self._id_index
+        items = self.items
+        visited = {task_id}
         current = blocked_by
 
         while current is not None:
-            if current in visited or current == task_id:
+            if current in visited:
                 return False
             visited.add(current)
 
-            task = self.get_item(current)
-            if task:
-                current = task.blocked_by
-            else:
-                break
+            position = index.get(current)
+            current = items[position].blocked_by if position is not None else None
 
         return True
 
 
 # Storage functions
 
+# Parsed todo lists keyed by file path, with the (mtime_ns, size) they were read at
+_todo_cache: Dict[Path, Tuple[int, int, TodoList]] = {}
+
+
+def _copy_todo_list(todo_list: TodoList) -> TodoList:
+    """Copy a todo list so callers can mutate items without touching the cache."""
+    return TodoList(
+        branch_name=todo_list.branch_name,
+        items=[copy.copy(item) for item in todo_list.items],
+    )
+
 
 def get_todos_file_path(branch_name: str) -> Path:
     """Get path to todos.yaml for a branch."""
     return get_branch_dir(branch_name) / "todos.yaml"
 
 
+def _get_sidecar_path(path: Path) -> Path:
+    """Get the JSON snapshot written alongside a todos.yaml file."""
+    return path.with_name(path.name + ".cache.json")
+
+
+def _load_sidecar(path: Path, st) -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON snapshot for a todos file if it was written from this YAML.
+
+    YAML stays the source of truth (and can be hand-edited); the snapshot
+    records the (mtime_ns, size) of the YAML it was saved with and is only
+    used while that still matches exactly, like the in-memory cache.
+
+    Returns:
+        The snapshot data, or None if it is missing, stale or unreadable
+    """
+    try:
+        data = json_loads(_get_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("source") != [st.st_mtime_ns, st.st_size]:
+        return None
+    return data
+
+
 def load_todos(branch_name: str) -> TodoList:
     """
     Load todo list from YAML file.
 
+    The parsed list is cached per file and reused while the file's
+    (mtime_ns, size) is unchanged; callers always get their own copy.
+
     Args:
         branch_name: Branch name
 
@@ -201,17 +295,28 @@ def load_todos(branch_name: str) -> TodoList:
         TodoList instance (empty if file doesn't exist)
     """
     path = get_todos_file_path(branch_name)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _todo_cache.pop(path, None)
         return TodoList(branch_name=branch_name, items=[])
 
+    cached = _todo_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return _copy_todo_list(cached[2])
+
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_sidecar(path, st)
+        if data is None:
+            with open(path) as f:
+                data = yaml.load(f, Loader=_Loader) or {}
 
         todos_data = data.get("todos", [])
         items = [TodoItem.from_dict(t) for t in todos_data]
 
-        return TodoList(branch_name=branch_name, items=items)
+        todo_list = TodoList(branch_name=branch_name, items=items)
+        _todo_cache[path] = (st.st_mtime_ns, st.st_size, _copy_todo_list(todo_list))
+        return todo_list
 
     except Exception as e:
         from ccc.utils import print_warning
@@ -232,8 +337,24 @@ def save_todos(todo_list: TodoList) -> None:
 
     data = {"todos": [item.to_dict() for item in todo_list.items]}
 
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    # Serialize in memory, then write a temp file in the same directory and
+    # rename it over the original so readers never see a partial file
+    buf = io.StringIO()
+    yaml.dump(data, buf, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+
+    atomic_write_bytes(path, buf.getvalue().encode(), prefix=".tmp-todos-")
+
+    # Snapshot for fast reloads, tagged with the YAML it matches
+    st = path.stat()
+    try:
+        _get_sidecar_path(path).write_bytes(
+            json_dumps({"source": [st.st_mtime_ns, st.st_size], **data})
+        )
+    except OSError:
+        pass
+
+    # What we just wrote is the new cached state
+    _todo_cache[path] = (st.st_mtime_ns, st.st_size, _copy_todo_list(todo_list))
 
 
 # CRUD operations
@@ -317,7 +438,7 @@ def update_todo_status(
     Returns:
         Updated TodoItem if found, None otherwise
     """
-    if status not in ["not_started", "in_progress", "done", "blocked"]:
+    if status not in _VALID_STATUSES:
         raise ValueError(f"Invalid status: {status}")
 
     todo_list = load_todos(branch_name)
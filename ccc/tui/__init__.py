@@ -1,41 +1,42 @@
 """
 TUI components for Command Center.
+
+Components are imported on first access so that importing a single
+submodule (or the package itself) doesn't pull in every Textual widget.
 """
 
-from ccc.tui.dialogs import (
-    BaseDialog,
-    ConfirmDialog,
-    MessageDialog,
-    ErrorDialog,
-    SuccessDialog,
-    CommitDialog,
-    LogDialog,
-    OutputDialog,
-    FileBrowserDialog,
-)
-
-from ccc.tui.widgets import (
-    FileCheckboxList,
-    MultiLineInput,
-    LogViewer,
-    StreamingOutput,
-)
-
-from ccc.tui.app import run_tui
-
-__all__ = [
-    "BaseDialog",
-    "ConfirmDialog",
-    "MessageDialog",
-    "ErrorDialog",
-    "SuccessDialog",
-    "CommitDialog",
-    "LogDialog",
-    "OutputDialog",
-    "FileBrowserDialog",
-    "FileCheckboxList",
-    "MultiLineInput",
-    "LogViewer",
-    "StreamingOutput",
-    "run_tui",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "BaseDialog": "ccc.tui.dialogs",
+    "ConfirmDialog": "ccc.tui.dialogs",
+    "MessageDialog": "ccc.tui.dialogs",
+    "ErrorDialog": "ccc.tui.dialogs",
+    "SuccessDialog": "ccc.tui.dialogs",
+    "CommitDialog": "ccc.tui.dialogs",
+    "LogDialog": "ccc.tui.dialogs",
+    "OutputDialog": "ccc.tui.dialogs",
+    "FileBrowserDialog": "ccc.tui.dialogs",
+    "FileCheckboxList": "ccc.tui.widgets",
+    "MultiLineInput": "ccc.tui.widgets",
+    "LogViewer": "ccc.tui.widgets",
+    "StreamingOutput": "ccc.tui.widgets",
+    "run_tui": "ccc.tui.app",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -4,7 +4,8 @@ API Testing TUI widgets for Command Center.
 Provides interactive dialogs and panels for API testing functionality.
 """
 
-from typing import Optional, List, Dict
+import time
+from typing import Callable, Optional, List, Dict, Tuple
 from pathlib import Path
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll
@@ -12,38 +13,56 @@ from textual.screen import ModalScreen
 from textual.widgets import Static, Button, Label, Input, Select, TextArea, LoadingIndicator
 from textual.binding import Binding
 from textual import work
+from textual.worker import get_current_worker
 
-from ccc.api_request import ApiRequest, ApiResponse, HttpMethod, VariableStore
+from ccc.api_request import ApiRequest, ApiRequestExecution, ApiResponse, HttpMethod, VariableStore
 from ccc.api_testing import (
     load_requests,
     add_request,
     update_request,
     execute_request,
     delete_request,
-    load_history,
+    load_last_execution_map,
+    get_api_history_path,
+    get_api_requests_path,
 )
+from ccc.tui.dialogs import ConfirmDialog, ErrorDialog
+from ccc.utils import format_time_ago
 
+# Method select options and value -> HttpMethod lookup, built once
+_METHOD_OPTIONS = tuple((m.value, m.value) for m in HttpMethod)
+_METHOD_BY_VALUE = {m.value: m for m in HttpMethod}
 
-class RequestBuilderDialog(ModalScreen):
-    """
-    Dialog for creating/editing API requests.
+# Blank line and help text shown under the API request list
+_LIST_FOOTER = [
+    "",
+    "[dim]Press Enter to execute • j/k to navigate • n to create • e to edit • d to delete[/dim]",
+]
 
-    Allows users to configure all aspects of an HTTP request including
-    method, URL, headers, body, and expected status code.
-    """
+# Longest response body shown in the viewer; anything past it is cut off
+MAX_BODY_DISPLAY_CHARS = 200_000
 
-    BINDINGS = [
-        Binding("escape", "dismiss", "Cancel", show=False),
-        Binding("ctrl+s", "save", "Save", show=True),
-        Binding("ctrl+t", "test", "Test Now", show=True),
-    ]
+# Delay used to coalesce bursts of list reloads into one (about one frame at 60 fps)
+REFRESH_COALESCE_SECONDS = 0.016
 
-    CSS = """
-    RequestBuilderDialog {
+
+def _stat_key(path: Path) -> Optional[Tuple[Path, int, int]]:
+    """Get a (path, mtime_ns, size) cache key for a file, or None if it can't be read."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _modal_css(dialog: str) -> str:
+    """Layout rules shared by the API modal dialogs, scoped to one dialog class."""
+    return f"""
+    {dialog} {{
         align: center middle;
-    }
+    }}
 
-    RequestBuilderDialog > Container {
+    {dialog} > Container {{
         width: 90;
         height: auto;
         max-height: 90%;
@@ -51,22 +70,43 @@ class RequestBuilderDialog(ModalScreen):
         border: thick $primary;
         padding: 1 2;
         layout: vertical;
-    }
+    }}
 
-    RequestBuilderDialog .form-content {
+    {dialog} .form-content {{
         width: 100%;
         height: 1fr;
         overflow: auto;
-    }
+    }}
 
-    RequestBuilderDialog .dialog-title {
+    {dialog} .dialog-title {{
         width: 100%;
         content-align: center middle;
         text-style: bold;
         color: $accent;
         margin-bottom: 1;
-    }
+    }}
 
+    {dialog} Button {{
+        margin: 0 1;
+    }}
+    """
+
+
+class RequestBuilderDialog(ModalScreen):
+    """
+    Dialog for creating/editing API requests.
+
+    Allows users to configure all aspects of an HTTP request including
+    method, URL, headers, body, and expected status code.
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Cancel", show=False),
+        Binding("ctrl+s", "save", "Save", show=True),
+        Binding("ctrl+t", "test", "Test Now", show=True),
+    ]
+
+    CSS = _modal_css("RequestBuilderDialog") + """
     RequestBuilderDialog Label {
         margin-top: 1;
         margin-bottom: 0;
@@ -99,10 +139,6 @@ class RequestBuilderDialog(ModalScreen):
         padding-top: 1;
     }
 
-    RequestBuilderDialog Button {
-        margin: 0 1;
-    }
-
     RequestBuilderDialog .header-row {
         layout: horizontal;
         width: 100%;
@@ -157,45 +193,50 @@ class RequestBuilderDialog(ModalScreen):
                     id="name-input"
                 )
                 name_input.disabled = self.is_edit  # Can't rename existing requests
+                self._name_input = name_input
                 yield name_input
 
                 yield Label("Method:")
-                method_options = [(m.value, m.value) for m in HttpMethod]
                 initial_method = self.request.method.value if self.request else "GET"
-                yield Select(
-                    method_options,
+                self._method_select = Select(
+                    _METHOD_OPTIONS,
                     value=initial_method,
                     id="method-select"
                 )
+                yield self._method_select
 
                 yield Label("URL:")
-                yield Input(
+                self._url_input = Input(
                     placeholder="https://api.example.com/endpoint or {{base_url}}/api/users",
                     value=self.request.url if self.request else "",
                     id="url-input"
                 )
+                yield self._url_input
 
                 yield Label("Headers (one per line, format: Key: Value):")
                 headers_text = ""
                 if self.request and self.request.headers:
-                    headers_text = "\n".join(f"{k}: {v}" for k, v in self.request.headers.items())
+                    headers_text = "\n".join([f"{k}: {v}" for k, v in self.request.headers.items()])
                 headers_area = TextArea(id="headers-input")
                 headers_area.text = headers_text
                 headers_area.show_line_numbers = False
+                self._headers_area = headers_area
                 yield headers_area
 
                 yield Label("Body (JSON, text, etc.):")
                 body_area = TextArea(id="body-input")
                 body_area.text = self.request.body if self.request and self.request.body else ""
                 body_area.show_line_numbers = False
+                self._body_area = body_area
                 yield body_area
 
                 yield Label("Expected Status (optional):")
-                yield Input(
+                self._expected_status_input = Input(
                     placeholder="200",
                     value=str(self.request.expected_status) if self.request and self.request.expected_status else "",
                     id="expected-status-input"
                 )
+                yield self._expected_status_input
 
             with Horizontal(classes="dialog-buttons"):
                 yield Button("Save", variant="primary", id="save-btn")
@@ -226,12 +267,12 @@ class RequestBuilderDialog(ModalScreen):
     def _do_save(self) -> None:
         """Save the request."""
         # Gather inputs
-        name = self.query_one("#name-input", Input).value.strip()
-        method_str = self.query_one("#method-select", Select).value
-        url = self.query_one("#url-input", Input).value.strip()
-        headers_text = self.query_one("#headers-input", TextArea).text
-        body = self.query_one("#body-input", TextArea).text.strip()
-        expected_status_str = self.query_one("#expected-status-input", Input).value.strip()
+        name = self._name_input.value.strip()
+        method_str = self._method_select.value
+        url = self._url_input.value.strip()
+        headers_text = self._headers_area.text
+        body = self._body_area.text.strip()
+        expected_status_str = self._expected_status_input.value.strip()
 
         # Validate
         if not name:
@@ -242,27 +283,32 @@ class RequestBuilderDialog(ModalScreen):
             self.app.notify("URL is required", severity="error")
             return
 
-        # Parse headers
+        method = _METHOD_BY_VALUE.get(method_str)
+        if method is None:
+            self.app.notify("Method is required", severity="error")
+            return
+
+        # Parse headers ("Key: Value" lines, split at the first ": "; others are ignored)
         headers_dict = {}
-        if headers_text.strip():
-            for line in headers_text.strip().split("\n"):
-                if ": " in line:
-                    key, value = line.split(": ", 1)
-                    headers_dict[key.strip()] = value.strip()
+        for line in headers_text.splitlines():
+            key, sep, value = line.partition(": ")
+            if sep:
+                headers_dict[key.strip()] = value.strip()
 
         # Parse expected status
+        # (isdecimal accepts exactly the digits int() does, unlike isdigit)
         expected_status = None
         if expected_status_str:
-            try:
+            if expected_status_str.isdecimal():
                 expected_status = int(expected_status_str)
-            except ValueError:
-                self.app.notify("Expected status must be a number", severity="error")
+            if expected_status is None or not 100 <= expected_status <= 599:
+                self.app.notify("Expected status must be a valid HTTP status code", severity="error")
                 return
 
         # Create or update request
         request = ApiRequest(
             name=name,
-            method=HttpMethod.from_string(method_str),
+            method=method,
             url=url,
             headers=headers_dict,
             body=body if body else None,
@@ -300,35 +346,7 @@ class ResponseViewerDialog(ModalScreen):
         Binding("b", "toggle_body", "Toggle Body", show=True),
     ]
 
-    CSS = """
-    ResponseViewerDialog {
-        align: center middle;
-    }
-
-    ResponseViewerDialog > Container {
-        width: 90;
-        height: auto;
-        max-height: 90%;
-        background: $surface;
-        border: thick $primary;
-        padding: 1 2;
-        layout: vertical;
-    }
-
-    ResponseViewerDialog .form-content {
-        width: 100%;
-        height: 1fr;
-        overflow: auto;
-    }
-
-    ResponseViewerDialog .dialog-title {
-        width: 100%;
-        content-align: center middle;
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-    }
-
+    CSS = _modal_css("ResponseViewerDialog") + """
     ResponseViewerDialog .status-line {
         width: 100%;
         text-style: bold;
@@ -366,6 +384,12 @@ class ResponseViewerDialog(ModalScreen):
         overflow: auto;
     }
 
+    ResponseViewerDialog #body-text {
+        height: 100%;
+        border: none;
+        padding: 0;
+    }
+
     ResponseViewerDialog .collapsed {
         display: none;
     }
@@ -378,10 +402,6 @@ class ResponseViewerDialog(ModalScreen):
         border-top: solid $primary-lighten-1;
         padding-top: 1;
     }
-
-    ResponseViewerDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(
@@ -389,6 +409,7 @@ class ResponseViewerDialog(ModalScreen):
         request_name: str,
         response: ApiResponse,
         expected_status: Optional[int] = None,
+        on_rerun: Optional[Callable[[], None]] = None,
         name: Optional[str] = None,
         id: Optional[str] = None,
         classes: Optional[str] = None,
@@ -400,6 +421,9 @@ class ResponseViewerDialog(ModalScreen):
             request_name: Name of the request
             response: ApiResponse to display
             expected_status: Expected status code (for assertion display)
+            on_rerun: Called on Re-run, keeping the dialog open for
+                update_response(); without it the dialog dismisses with
+                {"action": "rerun"}
             name: The name of the dialog
             id: The ID of the dialog in the DOM
             classes: The CSS classes for the dialog
@@ -408,9 +432,20 @@ class ResponseViewerDialog(ModalScreen):
         self.request_name = request_name
         self.response = response
         self.expected_status = expected_status
+        self.on_rerun = on_rerun
         self.headers_expanded = False  # Collapsed by default
         self.body_expanded = True      # Expanded by default
 
+        # Section contents are only built when a section is first shown
+        self._headers_mounted = False
+        self._body_mounted = False
+
+        # Focused widget id -> action run when Enter is pressed on it
+        self._enter_actions = {
+            "headers-toggle": self.action_toggle_headers,
+            "body-toggle": self.action_toggle_body,
+        }
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the dialog."""
         with Container():
@@ -418,54 +453,116 @@ class ResponseViewerDialog(ModalScreen):
 
             with VerticalScroll(classes="form-content"):
                 # Status line
-                status_color = self.response.status_color()
-                status_symbol = self.response.status_symbol()
-                status_text = f"[{status_color}]{status_symbol} {self.response.status_code} {self.response.reason}[/]     Time: {self.response.elapsed_ms:.0f}ms"
-                yield Static(status_text, classes="status-line")
+                self._status_line = Static(self._status_text(), classes="status-line")
+                yield self._status_line
 
                 # Assertion result
-                if self.expected_status is not None:
-                    if self.response.matches_expected(self.expected_status):
-                        yield Static(f"[green]✓ Status matches expected ({self.expected_status})[/green]")
-                    else:
-                        yield Static(f"[red]✗ Status does not match expected ({self.expected_status})[/red]")
+                self._assertion_line = Static(self._assertion_text())
+                self._assertion_line.display = self.expected_status is not None
+                yield self._assertion_line
 
                 # Headers (collapsed by default)
                 headers_indicator = "▼ Headers" if self.headers_expanded else "▶ Headers"
-                yield Button(headers_indicator, id="headers-toggle", classes="section-header", variant="default")
+                self._headers_toggle = Button(headers_indicator, id="headers-toggle", classes="section-header", variant="default")
+                yield self._headers_toggle
                 headers_scroll = VerticalScroll(id="headers-content", classes="section-content")
                 if not self.headers_expanded:
                     headers_scroll.styles.display = "none"
+                self._headers_content = headers_scroll
                 with headers_scroll:
-                    headers_text = "\n".join(f"{k}: {v}" for k, v in self.response.headers.items())
-                    # Use Static without markup by escaping [ and ] characters
-                    escaped_headers = headers_text.replace("[", "\\[").replace("]", "\\]")
-                    headers_widget = Static(escaped_headers)
-                    yield headers_widget
+                    if self.headers_expanded:
+                        yield self._build_headers_widget()
 
                 # Body (expanded by default)
                 body_indicator = "▼ Body" if self.body_expanded else "▶ Body"
-                yield Button(body_indicator, id="body-toggle", classes="section-header", variant="default")
+                self._body_toggle = Button(body_indicator, id="body-toggle", classes="section-header", variant="default")
+                yield self._body_toggle
                 body_scroll = VerticalScroll(id="body-content", classes="section-content")
                 if not self.body_expanded:
                     body_scroll.styles.display = "none"
+                self._body_content = body_scroll
                 with body_scroll:
-                    body_text = self.response.get_formatted_body()
-                    # Use Static without markup by escaping [ and ] characters
-                    escaped_body = body_text.replace("[", "\\[").replace("]", "\\]")
-                    body_widget = Static(escaped_body)
-                    yield body_widget
+                    if self.body_expanded:
+                        yield self._build_body_widget()
 
             with Horizontal(classes="dialog-buttons"):
                 yield Button("Close", variant="default", id="close-btn")
                 yield Button("Re-run", variant="primary", id="rerun-btn")
 
+    def _status_text(self) -> str:
+        """Format the status line for the current response."""
+        status_color = self.response.status_color()
+        status_symbol = self.response.status_symbol()
+        return f"[{status_color}]{status_symbol} {self.response.status_code} {self.response.reason}[/]     Time: {self.response.elapsed_ms:.0f}ms"
+
+    def _assertion_text(self) -> str:
+        """Format the expected-status check for the current response."""
+        if self.expected_status is None:
+            return ""
+        if self.response.matches_expected(self.expected_status):
+            return f"[green]✓ Status matches expected ({self.expected_status})[/green]"
+        return f"[red]✗ Status does not match expected ({self.expected_status})[/red]"
+
+    def _headers_text(self) -> str:
+        """Format the response headers, one "Key: Value" per line."""
+        return "\n".join([f"{k}: {v}" for k, v in self.response.headers.items()])
+
+    def _body_text(self) -> str:
+        """Get the formatted response body, cut off at MAX_BODY_DISPLAY_CHARS."""
+        body_text = self.response.get_formatted_body()
+        if len(body_text) > MAX_BODY_DISPLAY_CHARS:
+            body_text = body_text[:MAX_BODY_DISPLAY_CHARS] + "\n… (truncated)"
+        return body_text
+
+    def _build_headers_widget(self) -> Static:
+        """Build the headers section content."""
+        self._headers_mounted = True
+        # Show verbatim; markup=False avoids escaping [ and ] characters
+        self._headers_static = Static(self._headers_text(), markup=False)
+        return self._headers_static
+
+    def _build_body_widget(self) -> TextArea:
+        """
+        Build the body section content.
+
+        A read-only TextArea only renders the lines in view, so large bodies
+        don't have to be laid out in full on open or resize.
+        """
+        self._body_mounted = True
+        # Options are set as attributes rather than constructor arguments,
+        # which older supported Textual releases don't accept
+        body_area = TextArea(id="body-text")
+        body_area.text = self._body_text()
+        body_area.read_only = True
+        body_area.soft_wrap = False
+        body_area.show_line_numbers = False
+        self._body_area = body_area
+        return body_area
+
+    def update_response(self, response: ApiResponse) -> None:
+        """
+        Show a new response for the same request in place.
+
+        Only the widgets that display the response are updated; sections
+        that haven't been shown yet pick it up when first expanded.
+
+        Args:
+            response: ApiResponse to display
+        """
+        self.response = response
+        self._status_line.update(self._status_text())
+        self._assertion_line.update(self._assertion_text())
+        if self._headers_mounted:
+            self._headers_static.update(self._headers_text())
+        if self._body_mounted:
+            self._body_area.load_text(self._body_text())
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "close-btn":
             self.dismiss(None)
         elif event.button.id == "rerun-btn":
-            self.dismiss({"action": "rerun"})
+            self.action_rerun()
         elif event.button.id == "headers-toggle":
             event.stop()
             self.action_toggle_headers()
@@ -477,16 +574,10 @@ class ResponseViewerDialog(ModalScreen):
         """Handle key presses for toggling sections."""
         # Allow Enter to toggle focused headers when they have focus
         if event.key == "enter":
-            focused = self.focused
-            if focused and hasattr(focused, 'id'):
-                if focused.id == "headers-toggle":
-                    event.prevent_default()
-                    self.action_toggle_headers()
-                    return
-                elif focused.id == "body-toggle":
-                    event.prevent_default()
-                    self.action_toggle_body()
-                    return
+            action = self._enter_actions.get(getattr(self.focused, "id", None))
+            if action is not None:
+                event.prevent_default()
+                action()
 
     def action_dismiss(self) -> None:
         """Handle enter/escape key press."""
@@ -494,41 +585,38 @@ class ResponseViewerDialog(ModalScreen):
 
     def action_rerun(self) -> None:
         """Handle 'r' key press."""
-        self.dismiss({"action": "rerun"})
+        if self.on_rerun is not None:
+            self.on_rerun()
+        else:
+            self.dismiss({"action": "rerun"})
 
     def action_toggle_headers(self) -> None:
         """Toggle headers section visibility."""
         self.headers_expanded = not self.headers_expanded
-        try:
-            headers_content = self.query_one("#headers-content", VerticalScroll)
-            headers_toggle = self.query_one("#headers-toggle", Button)
+        headers_content = self._headers_content
 
-            if self.headers_expanded:
-                headers_content.styles.display = "block"
-                headers_toggle.label = "▼ Headers"
-            else:
-                headers_content.styles.display = "none"
-                headers_toggle.label = "▶ Headers"
-        except Exception as e:
-            # Silently fail - the dialog will still be usable
-            pass
+        if self.headers_expanded:
+            if not self._headers_mounted:
+                headers_content.mount(self._build_headers_widget())
+            headers_content.styles.display = "block"
+            self._headers_toggle.label = "▼ Headers"
+        else:
+            headers_content.styles.display = "none"
+            self._headers_toggle.label = "▶ Headers"
 
     def action_toggle_body(self) -> None:
         """Toggle body section visibility."""
         self.body_expanded = not self.body_expanded
-        try:
-            body_content = self.query_one("#body-content", VerticalScroll)
-            body_toggle = self.query_one("#body-toggle", Button)
+        body_content = self._body_content
 
-            if self.body_expanded:
-                body_content.styles.display = "block"
-                body_toggle.label = "▼ Body"
-            else:
-                body_content.styles.display = "none"
-                body_toggle.label = "▶ Body"
-        except Exception as e:
-            # Silently fail - the dialog will still be usable
-            pass
+        if self.body_expanded:
+            if not self._body_mounted:
+                body_content.mount(self._build_body_widget())
+            body_content.styles.display = "block"
+            self._body_toggle.label = "▼ Body"
+        else:
+            body_content.styles.display = "none"
+            self._body_toggle.label = "▶ Body"
 
 
 class ApiRequestListPanel(Static):
@@ -588,60 +676,172 @@ class ApiRequestListPanel(Static):
         self.can_focus = True
         self.border_title = "API Requests"
 
+        # (path, mtime_ns, size) of the requests file self.requests was loaded from
+        self._requests_key: Optional[Tuple[Path, int, int]] = None
+
+        # (path, mtime_ns, size) of the history file at the last reload check
+        self._history_key: Optional[Tuple[Path, int, int]] = None
+
+        # Most recent execution per request name, with the history file's
+        # (path, mtime_ns, size) and the request names it was built for
+        self._history_cache: Optional[
+            Tuple[Tuple[Tuple[Path, int, int], Tuple[str, ...]], Dict[str, ApiRequestExecution]]
+        ] = None
+
+        # Unhighlighted row text, rebuilt on the next render after a reload
+        # or once the minute it was built in (for the "time ago" column) ends
+        self._rendered_lines: Optional[List[str]] = None
+        self._rendered_minute: Optional[int] = None
+
+        # (focused index, full render output) for the current row text
+        self._render_cache: Optional[Tuple[int, str]] = None
+
+        # (name, method, last status code) -> formatted start of the row
+        self._line_cache: Dict[Tuple[str, str, Optional[int]], str] = {}
+
+        # Set while a coalesced reload is waiting for its timer
+        self._refresh_pending = False
+
+        # Open response dialog, reused when its request is re-run
+        self._response_dialog: Optional[ResponseViewerDialog] = None
+
     def on_mount(self) -> None:
         """Handle mount event."""
         self.refresh_requests()
 
     def refresh_requests(self) -> None:
-        """Reload requests from storage."""
-        self.requests, self.variables = load_requests(self.branch_name)
+        """
+        Reload requests from storage.
+
+        Called on every auto-refresh tick, so this is a no-op unless the
+        requests or history file changed (by mtime or size) or the minute
+        shown in the "time ago" column has rolled over.
+        """
+        changed = False
+
+        key = _stat_key(get_api_requests_path(self.branch_name))
+        if key is None or key != self._requests_key:
+            self.requests, self.variables = load_requests(self.branch_name)
+            # load_requests creates a missing file, so stat again for the key
+            self._requests_key = _stat_key(get_api_requests_path(self.branch_name))
+            changed = True
+
+        history_key = _stat_key(get_api_history_path(self.branch_name))
+        if history_key != self._history_key:
+            self._history_key = history_key
+            changed = True
+
+        if not changed and int(time.time() // 60) == self._rendered_minute:
+            return
+
         self._focused_index = min(self._focused_index, max(0, len(self.requests) - 1))
+        self._rendered_lines = None
         self.refresh()
 
-    def render(self) -> str:
-        """Render the request list."""
-        if not self.requests:
-            return "[dim]No API requests. Press 'n' to create one.[/dim]"
+    def _schedule_refresh(self) -> None:
+        """
+        Reload requests at the end of the current frame.
 
-        lines = []
-        for idx, req in enumerate(self.requests):
-            is_focused = idx == self._focused_index
+        Several changes in quick succession (e.g. re-running a request
+        repeatedly) collapse into a single reload.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.set_timer(REFRESH_COALESCE_SECONDS, self._flush_refresh)
 
+    def _flush_refresh(self) -> None:
+        """Run a reload scheduled by _schedule_refresh."""
+        self._refresh_pending = False
+        self.refresh_requests()
+
+    def _last_executions(self) -> Dict[str, ApiRequestExecution]:
+        """
+        Get the most recent execution of each request, keyed by request name.
+
+        Only executions of the listed requests are loaded. The history file is
+        only re-read when its mtime or size (or the set of requests) changes,
+        so repaints (e.g. moving focus) don't touch the disk.
+        """
+        names = tuple(req.name for req in self.requests)
+        stat_key = _stat_key(get_api_history_path(self.branch_name))
+
+        if (
+            stat_key is not None
+            and self._history_cache is not None
+            and self._history_cache[0] == (stat_key, names)
+        ):
+            return self._history_cache[1]
+
+        last_by_name = load_last_execution_map(self.branch_name, names)
+
+        if stat_key is not None:
+            self._history_cache = ((stat_key, names), last_by_name)
+        return last_by_name
+
+    def _build_lines(self) -> List[str]:
+        """Format one line per request, without focus highlighting."""
+        last_by_name = self._last_executions()
+
+        # The method/name/status part of a row only changes when one of those
+        # does, so reuse it across reloads; only the "time ago" is recomputed.
+        # Rebuilding the cache from the current rows keeps it bounded.
+        prefix_cache = self._line_cache
+        self._line_cache = {}
+
+        lines = []
+        for req in self.requests:
             # Get last execution info from history
-            history = load_history(self.branch_name, limit=50)
-            last_exec = next((h for h in history if h.request_name == req.name), None)
+            last_exec = last_by_name.get(req.name)
+            status_code = last_exec.response.status_code if last_exec and last_exec.response else None
 
-            status_indicator = ""
-            if last_exec and last_exec.response:
-                color = last_exec.response.status_color()
-                status_indicator = f"[{color}]{last_exec.response.status_code}[/]"
-            else:
-                status_indicator = "[dim]-[/dim]"
-
-            # Format line
-            method = f"[blue]{req.method.value:6s}[/]"
-            name = req.name[:25]
-            url = req.url[:30] + "..." if len(req.url) > 30 else req.url
-            last_run = ""
-            if req.last_executed:
-                from ccc.utils import format_time_ago
-                last_run = format_time_ago(req.last_executed)
-            else:
-                last_run = "Never"
+            key = (req.name, req.method.value, status_code)
+            prefix = prefix_cache.get(key)
+            if prefix is None:
+                if status_code is not None:
+                    color = last_exec.response.status_color()
+                    status_indicator = f"[{color}]{status_code}[/]"
+                else:
+                    status_indicator = "[dim]-[/dim]"
 
-            line = f"{method}  {name:25s}  {status_indicator:5s}  {last_run}"
+                # Format line
+                # The .25 precision truncates long names without a separate slice
+                prefix = f"[blue]{req.method.value:6s}[/]  {req.name:<25.25}  {status_indicator:5s}"
+            self._line_cache[key] = prefix
 
-            if is_focused:
-                lines.append(f"[reverse]{line}[/reverse]")
-            else:
-                lines.append(line)
+            last_run = format_time_ago(req.last_executed) if req.last_executed else "Never"
+            lines.append(f"{prefix}  {last_run}")
 
-        # Add help text footer
-        help_text = "[dim]Press Enter to execute • j/k to navigate • n to create • e to edit • d to delete[/dim]"
-        lines.append("")
-        lines.append(help_text)
+        return lines
 
-        return "\n".join(lines)
+    def render(self) -> str:
+        """Render the request list."""
+        if not self.requests:
+            return "[dim]No API requests. Press 'n' to create one.[/dim]"
+
+        # Row text is built once per reload (and per minute, to keep the
+        # "time ago" column current); moving focus only changes which row
+        # gets the highlight
+        minute = int(time.time() // 60)
+        if self._rendered_lines is None or minute != self._rendered_minute:
+            self._rendered_lines = self._build_lines()
+            self._rendered_minute = minute
+            self._render_cache = None
+
+        # Repaints with nothing changed (e.g. focus or resize events) reuse
+        # the previous output
+        if self._render_cache is not None and self._render_cache[0] == self._focused_index:
+            return self._render_cache[1]
+
+        # Rows plus the blank line and help text footer, sized in one go
+        rows = self._rendered_lines
+        lines = rows + _LIST_FOOTER
+        if self._focused_index < len(rows):
+            lines[self._focused_index] = f"[reverse]{rows[self._focused_index]}[/reverse]"
+
+        output = "\n".join(lines)
+        self._render_cache = (self._focused_index, output)
+        return output
 
     def action_execute(self) -> None:
         """Execute the selected request."""
@@ -669,12 +869,11 @@ class ApiRequestListPanel(Static):
         """Delete the selected request."""
         if self._focused_index < len(self.requests):
             request = self.requests[self._focused_index]
-            from ccc.tui.dialogs import ConfirmDialog
 
             def on_confirm(confirmed: bool):
                 if confirmed and delete_request(self.branch_name, request.name):
                     self.app.notify(f"Deleted request '{request.name}'", severity="information")
-                    self.refresh_requests()
+                    self._schedule_refresh()
 
             self.app.push_screen(
                 ConfirmDialog(
@@ -699,39 +898,74 @@ class ApiRequestListPanel(Static):
     def _execute_request(self, request: ApiRequest) -> None:
         """Execute a request and show response."""
         self.app.notify(f"Executing {request.name}...", severity="information")
+        # One exclusive group per request: re-running a request replaces its
+        # previous run, while different requests run side by side
+        self.run_worker(
+            lambda: self._execute_in_worker(request),
+            thread=True,
+            group=f"api-exec-{request.name}",
+            exclusive=True,
+            exit_on_error=False,
+        )
 
-        # Execute in background
-        import threading
-
-        def do_execute():
-            response, error = execute_request(request, self.variables)
-            self.app.call_from_thread(self._on_execute_complete, request, response, error)
+    def _execute_in_worker(self, request: ApiRequest) -> None:
+        """
+        Run the request on a Textual worker thread and report back on the UI thread.
 
-        thread = threading.Thread(target=do_execute, daemon=True)
-        thread.start()
+        Re-running the same request cancels this run; a cancelled worker drops
+        its result so only the latest run of that request reports back.
+        """
+        response, error = execute_request(request, self.variables)
+        if get_current_worker().is_cancelled:
+            return
+        self.app.call_from_thread(self._on_execute_complete, request, response, error)
 
     def _on_execute_complete(self, request: ApiRequest, response: Optional[ApiResponse], error: Optional[str]) -> None:
         """Handle request execution completion."""
         if error:
-            from ccc.tui.dialogs import ErrorDialog
             self.app.push_screen(ErrorDialog("Request Failed", error))
         elif response:
             # Update the last_executed timestamp
+            requests_path = get_api_requests_path(self.branch_name)
+            in_sync = _stat_key(requests_path) == self._requests_key
             request.update_last_executed()
-            update_request(self.branch_name, request)
+            updated = update_request(self.branch_name, request)
 
-            def on_response_action(result):
-                if result and result.get("action") == "rerun":
-                    self._execute_request(request)
+            # A re-run from the open dialog updates it in place rather than
+            # building a new one
+            dialog = self._response_dialog
+            if dialog is not None and dialog.is_active and dialog.request_name == request.name:
+                dialog.update_response(response)
+            else:
+                self._show_response(request, response)
+
+            # When the list was current and holds this request, the file now
+            # matches memory, so only the row text needs rebuilding
+            if updated and in_sync and any(req is request for req in self.requests):
+                self._requests_key = _stat_key(requests_path)
+                self._rendered_lines = None
+                self.refresh()
+            else:
+                self._schedule_refresh()
 
-            self.app.push_screen(
-                ResponseViewerDialog(request.name, response, request.expected_status),
-                on_response_action
-            )
-            self.refresh_requests()
+    def _show_response(self, request: ApiRequest, response: ApiResponse) -> None:
+        """Open a response dialog whose Re-run executes the request again."""
+
+        def on_dismiss(result):
+            if self._response_dialog is dialog:
+                self._response_dialog = None
+
+        dialog = ResponseViewerDialog(
+            request.name,
+            response,
+            request.expected_status,
+            on_rerun=lambda: self._execute_request(request),
+        )
+        self._response_dialog = dialog
+        self.app.push_screen(dialog, on_dismiss)
 
     def _on_request_saved(self, result) -> None:
         """Handle request save completion."""
         if result and result.get("success"):
             self.app.notify(result.get("message", "Request saved"), severity="information")
-            self.refresh_requests()
+            self._schedule_refresh()
@@ -16,10 +16,10 @@ from textual.reactive import reactive
 from rich.text import Text
 
 from ccc.ticket import Ticket, TicketRegistry
-from ccc.status import read_agent_status
+from ccc.status import read_agent_status, get_status_file_path
 from ccc.git_status import get_git_status
-from ccc.build_status import read_build_status
-from ccc.test_status import read_test_status
+from ccc.build_status import read_build_status, get_build_status_path
+from ccc.test_status import read_test_status, get_test_status_path
 from ccc.config import load_config
 from ccc.utils import format_time_ago
 from ccc.tui.widgets import StatusBar
@@ -42,6 +42,15 @@ from ccc.git_operations import (
 )
 from ccc.build_runner import run_build, run_tests
 
+# Agent status -> symbol shown in the agent panel
+_STATUS_SYMBOLS = {
+    'idle': '⚙',
+    'working': '⚙',
+    'complete': '✓',
+    'blocked': '⚠',
+    'error': '✗',
+}
+
 
 class StatusPanel(Static):
     """Base class for status panels."""
@@ -59,7 +68,60 @@ class StatusPanel(Static):
         return "No data available"
 
 
-class AgentStatusPanel(Static):
+class TextPanel(Static):
+    """Panel whose content is plain markup text; skips redraws when it is unchanged."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_text: Optional[str] = None
+
+    def update_text(self, text: str) -> None:
+        """Update the panel, unless it is already showing this text."""
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self.update(text)
+
+
+class StatusFilePanel(TextPanel):
+    """
+    Base class for panels rendered from a per-branch status file.
+
+    Remembers the file's mtime at the last render so periodic refreshes
+    can skip re-reading and re-rendering when nothing changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rendered_mtime_ns: Optional[int] = None
+
+    def status_file_path(self) -> Optional[Path]:
+        """Override in subclasses to return the status file for branch_name."""
+        return None
+
+    def _status_mtime_ns(self) -> Optional[int]:
+        """Get the status file's mtime, or None if it doesn't exist."""
+        path = self.status_file_path()
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def update_content(self):
+        """Override in subclasses to render the panel content."""
+        self.update_text("No data available")
+
+    def refresh_if_changed(self):
+        """Re-render only if the status file changed since the last render."""
+        if not self.branch_name:
+            return
+        if self._status_mtime_ns() != self._rendered_mtime_ns:
+            self.update_content()
+
+
+class AgentStatusPanel(StatusFilePanel):
     """Panel displaying agent status."""
 
     branch_name: reactive[Optional[str]] = reactive(None)
@@ -68,6 +130,9 @@ class AgentStatusPanel(Static):
         super().__init__(*args, **kwargs)
         self.border_title = "Agent Status"
 
+    def status_file_path(self) -> Path:
+        return get_status_file_path(self.branch_name)
+
     def watch_branch_name(self, branch_name: Optional[str]):
         """Update when ticket_id changes."""
         self.update_content()
@@ -75,23 +140,17 @@ class AgentStatusPanel(Static):
     def update_content(self):
         """Update the panel content."""
         if not self.branch_name:
-            self.update("No ticket selected")
+            self.update_text("No ticket selected")
             return
 
+        self._rendered_mtime_ns = self._status_mtime_ns()
         agent_status = read_agent_status(self.branch_name)
         if not agent_status:
-            self.update("⚙ Idle: Waiting for agent to start")
+            self.update_text("⚙ Idle: Waiting for agent to start")
             return
 
         # Format status
-        status_symbols = {
-            'idle': '⚙',
-            'working': '⚙',
-            'complete': '✓',
-            'blocked': '⚠',
-            'error': '✗',
-        }
-        symbol = status_symbols.get(agent_status.status, '○')
+        symbol = _STATUS_SYMBOLS.get(agent_status.status, '○')
 
         lines = []
         lines.append(f"{symbol} Status: {agent_status.status}")
@@ -105,10 +164,10 @@ class AgentStatusPanel(Static):
         if agent_status.blocked:
             lines.append("[yellow]⚠ Blocked[/yellow]")
 
-        self.update("\n".join(lines))
+        self.update_text("\n".join(lines))
 
 
-class GitStatusPanel(Static):
+class GitStatusPanel(TextPanel):
     """Panel displaying git status."""
 
     branch_name: reactive[Optional[str]] = reactive(None)
@@ -129,7 +188,7 @@ class GitStatusPanel(Static):
     def update_content(self):
         """Update the panel content."""
         if not self.branch_name or not self.worktree_path:
-            self.update("No ticket selected")
+            self.update_text("No ticket selected")
             return
 
         config = load_config()
@@ -140,7 +199,7 @@ class GitStatusPanel(Static):
         )
 
         if not git_status:
-            self.update("Unable to query git status")
+            self.update_text("Unable to query git status")
             return
 
         lines = []
@@ -154,10 +213,10 @@ class GitStatusPanel(Static):
             if git_status.last_commit_time:
                 lines.append(f"             {format_time_ago(git_status.last_commit_time)}")
 
-        self.update("\n".join(lines))
+        self.update_text("\n".join(lines))
 
 
-class BuildStatusPanel(Static):
+class BuildStatusPanel(StatusFilePanel):
     """Panel displaying build status."""
 
     branch_name: reactive[Optional[str]] = reactive(None)
@@ -166,6 +225,9 @@ class BuildStatusPanel(Static):
         super().__init__(*args, **kwargs)
         self.border_title = "Build Status"
 
+    def status_file_path(self) -> Path:
+        return get_build_status_path(self.branch_name)
+
     def watch_branch_name(self, branch_name: Optional[str]):
         """Update when ticket_id changes."""
         self.update_content()
@@ -173,12 +235,13 @@ class BuildStatusPanel(Static):
     def update_content(self):
         """Update the panel content."""
         if not self.branch_name:
-            self.update("No ticket selected")
+            self.update_text("No ticket selected")
             return
 
+        self._rendered_mtime_ns = self._status_mtime_ns()
         build_status = read_build_status(self.branch_name)
         if not build_status:
-            self.update("? Unknown - No builds recorded")
+            self.update_text("? Unknown - No builds recorded")
             return
 
         lines = []
@@ -201,10 +264,10 @@ class BuildStatusPanel(Static):
             lines.append(details)
             lines.append(f"Completed: {format_time_ago(build_status.last_build)}")
 
-        self.update("\n".join(lines))
+        self.update_text("\n".join(lines))
 
 
-class TestStatusPanel(Static):
+class TestStatusPanel(StatusFilePanel):
     """Panel displaying test status."""
 
     branch_name: reactive[Optional[str]] = reactive(None)
@@ -213,6 +276,9 @@ class TestStatusPanel(Static):
         super().__init__(*args, **kwargs)
         self.border_title = "Test Status"
 
+    def status_file_path(self) -> Path:
+        return get_test_status_path(self.branch_name)
+
     def watch_branch_name(self, branch_name: Optional[str]):
         """Update when ticket_id changes."""
         self.update_content()
@@ -220,12 +286,13 @@ class TestStatusPanel(Static):
     def update_content(self):
         """Update the panel content."""
         if not self.branch_name:
-            self.update("No ticket selected")
+            self.update_text("No ticket selected")
             return
 
+        self._rendered_mtime_ns = self._status_mtime_ns()
         test_status = read_test_status(self.branch_name)
         if not test_status:
-            self.update("? Unknown - No tests recorded")
+            self.update_text("? Unknown - No tests recorded")
             return
 
         lines = []
@@ -253,7 +320,7 @@ class TestStatusPanel(Static):
             for failure in test_status.failures[:3]:
                 lines.append(f"  • {failure.name}")
 
-        self.update("\n".join(lines))
+        self.update_text("\n".join(lines))
 
 
 class TicketDetailView(VerticalScroll):
@@ -354,9 +421,11 @@ class TicketDetailView(VerticalScroll):
         question_banner = self.query_one("#question-banner", QuestionNotificationBanner)
         question_banner.update_count()
 
-        # Update all status panels
+        # Update all status panels; file-backed ones only re-render when
+        # their status file has changed since the last render
         agent_panel = self.query_one("#agent-panel", AgentStatusPanel)
         agent_panel.branch_name = self.ticket.branch
+        agent_panel.refresh_if_changed()
 
         git_panel = self.query_one("#git-panel", GitStatusPanel)
         git_panel.branch_name = self.ticket.branch
@@ -364,9 +433,11 @@ class TicketDetailView(VerticalScroll):
 
         build_panel = self.query_one("#build-panel", BuildStatusPanel)
         build_panel.branch_name = self.ticket.branch
+        build_panel.refresh_if_changed()
 
         test_panel = self.query_one("#test-panel", TestStatusPanel)
         test_panel.branch_name = self.ticket.branch
+        test_panel.refresh_if_changed()
 
         # Refresh todo panel content only, don't refocus
         todo_panel = self.query_one("#todo-panel", TodoListWidget)
@@ -495,13 +566,20 @@ class CommandCenterTUI(App):
         config = load_config()
         self.set_interval(config.status_poll_interval, self.auto_refresh)
 
+    def on_unmount(self) -> None:
+        """Write any pending status update before the app exits."""
+        if self.status_monitor:
+            self.status_monitor.close()
+
     def load_tickets(self):
         """Load tickets from registry."""
-        self.tickets = self.registry.list_all()
+        from ccc.todo import list_todos
 
-        table = self.query_one("#ticket-table", DataTable)
-        table.clear()
+        self.tickets = self.registry.list_all()
 
+        # Read every ticket's status first so the table is only touched once
+        # all rows are ready, rather than between per-ticket disk reads
+        rows = []
         for ticket in self.tickets:
             # Extract display ID if available
             display_id = ticket.display_id or "-"
@@ -514,24 +592,33 @@ class CommandCenterTUI(App):
                 status_text = ticket.status
 
             # Phase 4: Get todo progress
-            from ccc.todo import list_todos
             todo_list = list_todos(ticket.branch)
             if todo_list.items:
                 stats = todo_list.progress_stats()
-                percentage = todo_list.progress_percentage()
+                percentage = todo_list.progress_percentage(stats)
                 progress_text = f"{stats['done']}/{stats['total']} ({percentage:.0f}%)"
             else:
                 progress_text = "-"
 
-            table.add_row(
-                display_id,
-                ticket.branch[:25],
-                ticket.title[:25],
-                progress_text,
-                status_text,
-                format_time_ago(ticket.updated_at),
-                key=ticket.branch,
-            )
+            rows.append((
+                ticket.branch,
+                (
+                    display_id,
+                    ticket.branch[:25],
+                    ticket.title[:25],
+                    progress_text,
+                    status_text,
+                    format_time_ago(ticket.updated_at),
+                ),
+            ))
+
+        # Rows need their branch as the key, which add_rows can't set, so add
+        # them one by one inside a single batched update
+        table = self.query_one("#ticket-table", DataTable)
+        with self.batch_update():
+            table.clear()
+            for branch, cells in rows:
+                table.add_row(*cells, key=branch)
 
         # Select first ticket if available
         if self.tickets and not self.selected_ticket_id:
@@ -557,6 +644,8 @@ class CommandCenterTUI(App):
 
         # Initialize or update status monitor for this branch
         if not self.status_monitor or self.status_monitor.branch_name != self.selected_ticket_id:
+            if self.status_monitor:
+                self.status_monitor.close()
             self.status_monitor = StatusMonitor(
                 branch_name=self.selected_ticket_id,
                 config=self.config.to_dict(),
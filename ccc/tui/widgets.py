@@ -738,7 +738,7 @@ class TodoListWidget(VerticalScroll):
 
         todo_list = list_todos(self.branch_name)
         stats = todo_list.progress_stats()
-        percentage = todo_list.progress_percentage()
+        percentage = todo_list.progress_percentage(stats)
 
         content = (
             f"[bold]Progress:[/bold] {stats['done']}/{stats['total']} complete ({percentage:.0f}%)\n"
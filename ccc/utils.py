@@ -2,11 +2,16 @@
 Utility functions for Command Center
 """
 
+import json
 import os
 import re
+import stat
+import sys
+import tempfile
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from dateutil import tz
 from rich.console import Console
@@ -15,6 +20,67 @@ from rich.text import Text
 
 console = Console()
 
+# Keyword arguments for @dataclass that add __slots__ where supported
+# (the slots option needs Python 3.10+; on 3.9 classes keep a __dict__)
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes (orjson fast path)."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+
+    json_loads = orjson.loads
+
+except ImportError:  # orjson is an optional accelerator
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    json_loads = json.loads
+
+# Process umask, read once at import (reading it means briefly setting it,
+# which isn't safe to do later from worker threads)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path: Path, data: bytes, prefix: str = ".tmp-", fsync: bool = False) -> None:
+    """
+    Atomically replace a file's contents.
+
+    Writes a temp file in the same directory and renames it over the target,
+    so readers see either the old or the new complete file. The target keeps
+    its existing permissions (new files get the usual umask-based mode rather
+    than mkstemp's 0600).
+
+    Args:
+        path: File to write; its directory must exist
+        data: Contents to write
+        prefix: Name prefix for the temp file
+        fsync: Flush the data to disk before renaming
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=prefix, suffix=path.suffix)
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
 
 def get_ccc_home() -> Path:
     """
@@ -77,6 +143,17 @@ def extract_display_id(branch_name: str) -> Optional[str]:
     return match.group(0) if match else None
 
 
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, memoized.
+
+    Stored timestamps are re-read on every load but rarely change, and
+    datetimes are immutable, so repeated loads share one parsed instance.
+    """
+    return datetime.fromisoformat(value)
+
+
 def format_time_ago(dt: datetime) -> str:
     """
     Format a datetime as a human-readable "time ago" string.
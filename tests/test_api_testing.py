@@ -0,0 +1,76 @@
+"""
+Tests for API request storage
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from ccc.api_request import ApiRequestExecution, ApiResponse
+from ccc.api_testing import load_last_execution_map, save_history
+
+
+@pytest.fixture
+def branch_dir(tmp_path):
+    """Point branch metadata at a temporary directory."""
+    with patch("ccc.utils.get_branch_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+def _execution(name, status_code, minutes_ago):
+    """Build a history entry for a request run some minutes ago."""
+    return ApiRequestExecution(
+        request_name=name,
+        method="GET",
+        url=f"https://example.com/{name}",
+        response=ApiResponse(status_code=status_code, reason="", headers={}, body="", elapsed_ms=1.0),
+        timestamp=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+    )
+
+
+def test_load_last_execution_map_keeps_latest_per_name(branch_dir):
+    """Test that only the newest execution of each request is returned."""
+    save_history("feature/test", [
+        _execution("users", 500, minutes_ago=10),
+        _execution("users", 200, minutes_ago=1),
+        _execution("orders", 404, minutes_ago=5),
+    ])
+
+    last = load_last_execution_map("feature/test")
+
+    assert set(last) == {"users", "orders"}
+    assert last["users"].response.status_code == 200
+    assert last["orders"].response.status_code == 404
+
+
+def test_load_last_execution_map_filters_names(branch_dir):
+    """Test that executions of other requests are skipped."""
+    save_history("feature/test", [
+        _execution("users", 200, minutes_ago=1),
+        _execution("orders", 404, minutes_ago=5),
+    ])
+
+    last = load_last_execution_map("feature/test", ["orders", "missing"])
+
+    assert list(last) == ["orders"]
+
+
+def test_load_last_execution_map_empty_history(branch_dir):
+    """Test that a branch without history gives an empty map."""
+    assert load_last_execution_map("feature/test") == {}
+
+
+def test_load_last_execution_map_skips_malformed_entries(branch_dir):
+    """Test that one bad history entry doesn't hide the others."""
+    save_history("feature/test", [_execution("users", 200, minutes_ago=1)])
+    history_path = branch_dir / "api-history.yaml"
+    history_path.write_text(
+        history_path.read_text()
+        + "- request_name: broken\n  timestamp: not-a-date\n"
+        + "- timestamp: '2025-01-01T00:00:00+00:00'\n"
+    )
+
+    last = load_last_execution_map("feature/test")
+
+    assert list(last) == ["users"]
@@ -0,0 +1,111 @@
+"""
+Tests for the API testing TUI widgets
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from textual.app import App
+
+from ccc.api_request import ApiRequest, ApiResponse, HttpMethod
+from ccc.api_testing import add_request, load_requests
+from ccc.tui.api_widgets import ApiRequestListPanel, ResponseViewerDialog
+
+
+@pytest.fixture
+def branch_dir(tmp_path):
+    """Point branch metadata at a temporary directory."""
+    with patch("ccc.utils.get_branch_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+class PanelApp(App):
+    """Minimal app hosting a single request list panel."""
+
+    def compose(self):
+        yield ApiRequestListPanel("feature/test")
+
+
+def _slow_execute(request, variables):
+    """Stand-in for execute_request that takes a moment to respond."""
+    time.sleep(0.2)
+    return ApiResponse(status_code=200, reason="OK", headers={}, body="", elapsed_ms=1.0), None
+
+
+async def _wait_for_workers(app):
+    """Wait until every worker has finished, including cancelled ones."""
+    while any(not worker.is_finished for worker in app.workers):
+        await asyncio.sleep(0.05)
+
+
+def test_different_requests_both_complete(branch_dir):
+    """Executing a second request doesn't drop the result of the first."""
+    add_request("feature/test", ApiRequest(name="create", method=HttpMethod.POST, url="http://x/a"))
+    add_request("feature/test", ApiRequest(name="list", method=HttpMethod.GET, url="http://x/b"))
+
+    async def run():
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ApiRequestListPanel)
+            with patch("ccc.tui.api_widgets.execute_request", side_effect=_slow_execute):
+                panel.action_execute()
+                panel.action_move_down()
+                panel.action_execute()
+                await _wait_for_workers(app)
+                await pilot.pause()
+            return [s.request_name for s in app.screen_stack if isinstance(s, ResponseViewerDialog)]
+
+    shown = asyncio.run(run())
+
+    assert sorted(shown) == ["create", "list"]
+    requests, _ = load_requests("feature/test")
+    assert all(r.last_executed is not None for r in requests)
+
+
+def test_rerun_of_same_request_reports_once(branch_dir):
+    """Re-running a request before it returns only reports the latest run."""
+    add_request("feature/test", ApiRequest(name="list", method=HttpMethod.GET, url="http://x/b"))
+
+    async def run():
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ApiRequestListPanel)
+            with patch("ccc.tui.api_widgets.execute_request", side_effect=_slow_execute):
+                panel.action_execute()
+                panel.action_execute()
+                await _wait_for_workers(app)
+                await pilot.pause()
+            return [s for s in app.screen_stack if isinstance(s, ResponseViewerDialog)]
+
+    assert len(asyncio.run(run())) == 1
+
+
+def test_refresh_requests_skips_unchanged_files(branch_dir):
+    """Auto-refresh ticks don't rebuild rows unless the request files change."""
+    add_request("feature/test", ApiRequest(name="list", method=HttpMethod.GET, url="http://x/b"))
+
+    async def run():
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ApiRequestListPanel)
+            await pilot.pause()
+            # Pin the clock so a minute rollover can't trigger a rebuild
+            panel._rendered_minute = 0
+            with patch("ccc.tui.api_widgets.time.time", return_value=30.0), \
+                    patch.object(panel, "_build_lines", wraps=panel._build_lines) as mock_build:
+                panel.refresh_requests()
+                panel.render()
+                unchanged_builds = mock_build.call_count
+
+                add_request("feature/test", ApiRequest(name="get", method=HttpMethod.GET, url="http://x/c"))
+                panel.refresh_requests()
+                panel.render()
+            return unchanged_builds, mock_build.call_count, len(panel.requests)
+
+    unchanged_builds, total_builds, request_count = asyncio.run(run())
+
+    assert unchanged_builds == 0
+    assert total_builds == 1
+    assert request_count == 2
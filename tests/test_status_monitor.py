@@ -3,6 +3,7 @@ Unit tests for status_monitor module.
 """
 
 import json
+import os
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -186,6 +187,20 @@ class TestLogPatternMatcher:
         url = matcher.extract_server_url("Serving on http://0.0.0.0:8000")
         assert url == "http://localhost:8000"
 
+    def test_extract_server_port(self):
+        """Test extracting the port number directly."""
+        matcher = LogPatternMatcher()
+
+        assert matcher.extract_server_port("Listening at http://127.0.0.1:5173") == 5173
+        assert matcher.extract_server_port("Building project...") is None
+
+    def test_extract_server_port_non_numeric_capture(self):
+        """Test a custom ready pattern that captures a host instead of a port."""
+        matcher = LogPatternMatcher(ready_patterns=[r"Ready at (\S+)"])
+
+        assert matcher.extract_server_port("Ready at example.local") is None
+        assert matcher.extract_server_url("Ready at example.local") == "http://localhost:example.local"
+
     def test_extract_server_url_no_match(self):
         """Test log line with no server URL."""
         matcher = LogPatternMatcher()
@@ -291,6 +306,17 @@ class TestStatusMonitor:
         assert loaded_status.server.port == 3000
         assert loaded_status.database.state == "connected"
 
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_database_target_parsed_once(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test the database host/port is parsed from config at init."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        mock_config["database_connection_string"] = "postgresql://user:pw@db.local:6543/app"
+        assert StatusMonitor("test-branch", mock_config)._db_host_port == ("db.local", 6543)
+
+        mock_config["database_connection_string"] = "postgresql://localhost/app"
+        assert StatusMonitor("test-branch", mock_config)._db_host_port is None
+
     @patch("ccc.status_monitor.get_branch_dir")
     def test_update_server_status(self, mock_get_branch_dir, mock_config, temp_dir):
         """Test updating server status."""
@@ -328,6 +354,21 @@ class TestStatusMonitor:
         assert status.server.url == "http://localhost:3000"
         assert status.server.port == 3000
 
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_handle_server_output_non_numeric_capture(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test a ready pattern capturing a non-numeric value still marks the server healthy."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        monitor = StatusMonitor("test-branch", mock_config)
+        monitor.log_matcher = LogPatternMatcher(ready_patterns=[r"Ready at (\S+)"])
+
+        monitor._handle_server_output("Ready at example.local")
+
+        status = monitor.load_status()
+        assert status.server.state == "healthy"
+        assert status.server.url == "http://localhost:example.local"
+        assert status.server.port is None
+
     @patch("ccc.status_monitor.get_branch_dir")
     def test_handle_server_output_detects_error(self, mock_get_branch_dir, mock_config, temp_dir):
         """Test server output parsing detects errors."""
@@ -357,3 +398,115 @@ class TestStatusMonitor:
         # Verify callback was called
         assert callback.called
         assert callback.call_args[0][0].server.state == "healthy"
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_load_status_uses_cache_until_file_changes(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test load_status reuses the cached state until the file is modified."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        monitor = StatusMonitor("test-branch", mock_config)
+        monitor._update_server_status(state="healthy")
+        monitor.flush()
+
+        with patch("ccc.status_monitor.json_loads") as mock_load:
+            status = monitor.load_status()
+            assert not mock_load.called
+        assert status.server.state == "healthy"
+
+        # External write with a different mtime forces a reload
+        data = json.loads(monitor.state_file.read_text())
+        data["server"]["state"] = "unhealthy"
+        monitor.state_file.write_text(json.dumps(data))
+        os.utime(monitor.state_file, ns=(0, monitor._cached_mtime_ns + 1_000_000))
+
+        assert monitor.load_status().server.state == "unhealthy"
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_load_status_retries_once_on_decode_error(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test load_status retries a torn read and falls back to default on corruption."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        monitor = StatusMonitor("test-branch", mock_config)
+        monitor.state_file.write_text("{not json")
+
+        with patch("ccc.status_monitor.time.sleep") as mock_sleep:
+            status = monitor.load_status()
+
+        assert mock_sleep.call_count == 1
+        assert status.server.state == "stopped"
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_updates_are_coalesced_into_one_write(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test a burst of updates produces a single write on flush."""
+        mock_get_branch_dir.return_value = temp_dir
+        mock_config["status_flush_interval_ms"] = 60_000
+
+        monitor = StatusMonitor("test-branch", mock_config)
+
+        with patch.object(monitor, "save_status", wraps=monitor.save_status) as mock_save:
+            monitor._update_server_status(state="starting")
+            monitor._update_server_status(state="healthy", port=3000)
+            monitor._update_database_status(state="connected")
+
+            # Pending state is visible before it reaches disk
+            assert not monitor.state_file.exists()
+            assert monitor.load_status().server.state == "healthy"
+
+            monitor.flush()
+
+        assert mock_save.call_count == 1
+        data = json.loads(monitor.state_file.read_text())
+        assert data["server"]["state"] == "healthy"
+        assert data["server"]["port"] == 3000
+        assert data["database"]["state"] == "connected"
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_unchanged_update_is_skipped(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test an update that changes nothing neither writes nor notifies."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        callback = Mock()
+        monitor = StatusMonitor("test-branch", mock_config, on_status_change=callback)
+        monitor._update_server_status(state="healthy", port=3000)
+        monitor.flush()
+        assert callback.call_count == 1
+
+        with patch.object(monitor, "save_status") as mock_save:
+            monitor._update_server_status(state="healthy", port=3000)
+            monitor.flush()
+
+        assert not mock_save.called
+        assert callback.call_count == 1
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_save_status_leaves_no_temp_files(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test saving replaces the state file without leaving temp files behind."""
+        mock_get_branch_dir.return_value = temp_dir
+
+        monitor = StatusMonitor("test-branch", mock_config)
+        monitor.save_status(monitor._default_status())
+        monitor.save_status(monitor._default_status())
+
+        with patch("ccc.utils.os.replace", side_effect=OSError("boom")):
+            monitor.save_status(monitor._default_status())
+
+        assert [p.name for p in temp_dir.iterdir()] == ["status-bar.json"]
+
+    @patch("ccc.status_monitor.get_branch_dir")
+    def test_check_database_connection_refused(self, mock_get_branch_dir, mock_config, temp_dir):
+        """Test an unreachable database is reported as refused."""
+        mock_get_branch_dir.return_value = temp_dir
+        mock_config["database_connection_string"] = "postgresql://user:pw@localhost:5432/testdb"
+        mock_config["status_flush_interval_ms"] = 0
+
+        monitor = StatusMonitor("test-branch", mock_config)
+
+        with patch("ccc.status_monitor.socket.create_connection",
+                   side_effect=ConnectionRefusedError()) as mock_connect:
+            monitor.check_database_connection()
+            monitor._check_pool.shutdown(wait=True)
+
+        mock_connect.assert_called_once_with(("localhost", 5432), timeout=2)
+        status = monitor.load_status()
+        assert status.database.state == "error"
+        assert status.database.error_message == "Connection refused"
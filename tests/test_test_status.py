@@ -234,9 +234,8 @@ class TestReadWriteTestStatus:
             "failures": [],
         }
 
-        with patch.object(Path, "exists", return_value=True):
-            with patch("json.load", return_value=data):
-                status = read_test_status("TEST-001")
+        with patch.object(Path, "read_bytes", return_value=json.dumps(data).encode()):
+            status = read_test_status("TEST-001")
 
         assert status is not None
         assert status.ticket_id == "TEST-001"
@@ -246,7 +245,7 @@ class TestReadWriteTestStatus:
     def test_read_test_status_file_not_exists(self, mock_get_path):
         """Test reading test status when file doesn't exist."""
         mock_path = MagicMock()
-        mock_path.exists.return_value = False
+        mock_path.read_bytes.side_effect = FileNotFoundError()
         mock_get_path.return_value = mock_path
 
         status = read_test_status("TEST-001")
@@ -257,11 +256,10 @@ class TestReadWriteTestStatus:
     def test_read_test_status_error(self, mock_get_path):
         """Test reading test status with error."""
         mock_path = MagicMock()
-        mock_path.exists.return_value = True
+        mock_path.read_bytes.return_value = b"{not json"
         mock_get_path.return_value = mock_path
 
-        with patch("builtins.open", side_effect=Exception("JSON error")):
-            status = read_test_status("TEST-001")
+        status = read_test_status("TEST-001")
 
         assert status is None
 
@@ -282,12 +280,12 @@ class TestReadWriteTestStatus:
             skipped=0,
         )
 
-        with patch("json.dump") as mock_json_dump:
+        with patch("ccc.test_status.json_dumps", return_value=b"{}") as mock_json_dumps:
             result = write_test_status(status)
 
         assert result is True
         assert status.last_run is not None
-        mock_json_dump.assert_called_once()
+        mock_json_dumps.assert_called_once()
 
     @patch("ccc.test_status.get_test_status_path")
     def test_write_test_status_error(self, mock_get_path):
@@ -346,6 +344,21 @@ class TestInitAndUpdateTestStatus:
         assert call_args.total == 50
         assert call_args.passed == 50
 
+    @patch("ccc.test_status.read_test_status")
+    @patch("ccc.test_status.write_test_status")
+    def test_update_test_status_caps_failures(self, mock_write, mock_read):
+        """Test only the first failures are stored and the rest are counted."""
+        mock_read.return_value = None
+        mock_write.return_value = True
+
+        failures = [TestFailure(f"test_{i}", "Error") for i in range(10)]
+        update_test_status("TEST-001", "failing", failures=failures, max_stored_failures=3)
+
+        call_args = mock_write.call_args[0][0]
+        assert [f.name for f in call_args.failures] == ["test_0", "test_1", "test_2"]
+        assert call_args.truncated_failure_count == 7
+        assert "... and 5 more" in format_test_status(call_args)
+
     @patch("ccc.test_status.read_test_status")
     @patch("ccc.test_status.write_test_status")
     def test_update_test_status_existing(self, mock_write, mock_read):
@@ -437,6 +450,49 @@ class TestParseTestOutput:
         assert result["passed"] == 50
         assert result["failed"] == 0
 
+    def test_parse_pytest_output_failed_first(self):
+        """Test parsing pytest's failed-first summary ordering."""
+        output = "===== 2 failed, 47 passed, 1 skipped in 12.34s ====="
+
+        result = _parse_pytest_output(output)
+
+        assert result["total"] == 50
+        assert result["passed"] == 47
+        assert result["failed"] == 2
+        assert result["skipped"] == 1
+
+    def test_parse_pytest_output_with_trailing_wrapper_output(self):
+        """Test counts aren't cut short by output printed after the summary."""
+        summary = "===== 1234 passed, 56 failed in 99.0s =====\n"
+
+        # 476 characters of trailing output puts the window edge inside "1234"
+        for trailing in (476, 2000):
+            wrapper = "\n".join(["py311: commands succeeded"] * (trailing // 26 + 1))[:trailing]
+            output = "." * 3000 + "\n" + summary + wrapper
+
+            result = _parse_pytest_output(output)
+
+            assert result["passed"] == 1234
+            assert result["failed"] == 56
+
+    def test_parse_pytest_output_ignores_counts_before_summary(self):
+        """Test only the trailing summary of a long pytest log is parsed."""
+        output = "collected: 9 passed earlier\n" + "." * 2000 + "\n===== 4 passed in 1.0s =====\n"
+
+        result = _parse_pytest_output(output)
+
+        assert result["passed"] == 4
+        assert result["total"] == 4
+
+    def test_parse_jest_output_uses_last_summary(self):
+        """Test the final Jest summary wins when several are printed."""
+        output = "Tests: 1 failed, 3 total\n...\nTests: 5 passed, 5 total\n"
+
+        result = _parse_jest_output(output)
+
+        assert result["total"] == 5
+        assert result["failed"] == 0
+
     def test_parse_go_output(self):
         """Test parsing Go test output."""
         output = """
@@ -472,6 +528,22 @@ PASS
         assert result["passed"] == 5
         assert result["failed"] == 1
 
+    def test_parse_test_output_auto_detect_pytest_summary(self):
+        """Test auto-detecting pytest from its summary line alone."""
+        result = parse_test_output("===== 3 passed, 1 skipped in 0.5s =====", framework="auto")
+
+        assert result["passed"] == 3
+        assert result["skipped"] == 1
+
+    def test_parse_test_output_auto_detect_go(self):
+        """Test auto-detecting Go output."""
+        output = "--- PASS: TestA\n--- FAIL: TestB\nFAIL\nok  \texample.com/pkg\t0.1s\n"
+
+        result = parse_test_output(output, framework="auto")
+
+        assert result["passed"] == 1
+        assert result["failed"] == 1
+
     def test_parse_test_output_explicit_framework(self):
         """Test parsing with explicit framework."""
         output = "Tests: 20 passed, 20 total"
@@ -3,38 +3,38 @@ Basic tests for ticket functionality
 """
 
 from datetime import datetime, timezone
-from ccc.ticket import Ticket, create_ticket
+from unittest.mock import patch
+
+from ccc.ticket import Ticket, TicketRegistry, create_ticket
 
 
 def test_create_ticket():
     """Test creating a ticket instance."""
     ticket = create_ticket(
-        ticket_id="TEST-001",
-        title="Test Ticket",
         branch="feature/TEST-001-test-ticket",
+        title="Test Ticket",
         worktree_path="/tmp/test-001",
     )
 
-    assert ticket.id == "TEST-001"
-    assert ticket.title == "Test Ticket"
     assert ticket.branch == "feature/TEST-001-test-ticket"
+    assert ticket.display_id == "TEST-001"
+    assert ticket.title == "Test Ticket"
     assert ticket.worktree_path == "/tmp/test-001"
-    assert ticket.tmux_session == "ccc-TEST-001"
+    assert ticket.tmux_session == "ccc-feature-TEST-001-test-ticket"
     assert ticket.status == "active"
 
 
 def test_ticket_to_dict():
     """Test converting ticket to dictionary."""
     ticket = create_ticket(
-        ticket_id="TEST-002",
-        title="Another Test",
         branch="feature/test",
+        title="Another Test",
         worktree_path="/tmp/test",
     )
 
     ticket_dict = ticket.to_dict()
 
-    assert ticket_dict["id"] == "TEST-002"
+    assert ticket_dict["branch"] == "feature/test"
     assert ticket_dict["title"] == "Another Test"
     assert "created_at" in ticket_dict
     assert "updated_at" in ticket_dict
@@ -43,11 +43,10 @@ def test_ticket_to_dict():
 def test_ticket_from_dict():
     """Test creating ticket from dictionary."""
     data = {
-        "id": "TEST-003",
+        "branch": "feature/TEST-003-dict",
         "title": "Dict Test",
-        "branch": "feature/test",
         "worktree_path": "/tmp/test",
-        "tmux_session": "ccc-TEST-003",
+        "tmux_session": "ccc-feature-TEST-003-dict",
         "status": "active",
         "created_at": "2025-11-10T12:00:00+00:00",
         "updated_at": "2025-11-10T12:00:00+00:00",
@@ -55,6 +54,114 @@ def test_ticket_from_dict():
 
     ticket = Ticket.from_dict(data)
 
-    assert ticket.id == "TEST-003"
+    assert ticket.branch == "feature/TEST-003-dict"
     assert ticket.title == "Dict Test"
     assert isinstance(ticket.created_at, datetime)
+
+
+def test_registry_reuses_parsed_tickets(tmp_path):
+    """Test the registry only re-parses the file when it changes on disk."""
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        registry = TicketRegistry()
+        registry.add(create_ticket("feature/a", "A", "/tmp/a", tmux_session="ccc-a"))
+
+        with patch("ccc.ticket.json_loads") as mock_load:
+            assert registry.get("feature/a").title == "A"
+            assert not mock_load.called
+
+        # Another writer (e.g. a second registry instance) invalidates the cache
+        other = TicketRegistry()
+        other.add(create_ticket("feature/b", "B", "/tmp/b", tmux_session="ccc-b"))
+
+        assert [t.branch for t in registry.list_all()] == ["feature/a", "feature/b"]
+
+
+def test_registry_reads_legacy_yaml(tmp_path):
+    """Test a pre-JSON tickets.yaml is read and migrated on the next save."""
+    (tmp_path / "tickets.yaml").write_text(
+        "tickets:\n"
+        "- branch: feature/old\n"
+        "  title: Old\n"
+        "  worktree_path: /tmp/old\n"
+        "  tmux_session: ccc-old\n"
+        "  status: active\n"
+        "  created_at: '2025-11-10T12:00:00+00:00'\n"
+        "  updated_at: '2025-11-10T12:00:00+00:00'\n"
+    )
+
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        registry = TicketRegistry()
+        assert registry.get("feature/old").title == "Old"
+
+        registry.add(create_ticket("feature/new", "New", "/tmp/new", tmux_session="ccc-new"))
+
+        assert (tmp_path / "tickets.json").exists()
+        assert [t.branch for t in TicketRegistry().list_all()] == ["feature/old", "feature/new"]
+
+
+def test_registry_branch_lookups(tmp_path):
+    """Test indexed get/get_many/exists/delete on the registry."""
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        registry = TicketRegistry()
+        for name in ("a", "b", "c"):
+            registry.add(create_ticket(f"feature/{name}", name.upper(), f"/tmp/{name}", tmux_session=f"ccc-{name}"))
+
+        assert registry.exists("feature/b")
+        assert set(registry.get_many(["feature/a", "feature/c", "feature/x"])) == {"feature/a", "feature/c"}
+
+        registry.delete("feature/b")
+        assert registry.get("feature/b") is None
+        assert registry.get("feature/c").title == "C"
+
+
+def test_registry_returns_copies(tmp_path):
+    """Test unsaved changes to returned tickets don't leak into the registry."""
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        registry = TicketRegistry()
+        ticket = create_ticket("feature/a", "A", "/tmp/a", tmux_session="ccc-a")
+        registry.add(ticket)
+        ticket.title = "Changed after add"
+
+        registry.get("feature/a").title = "Changed"
+        registry.load()[0].status = "complete"
+        registry.get_many(["feature/a"])["feature/a"].title = "Changed"
+        registry.list_by_status("active")[0].title = "Changed"
+
+        assert registry.get("feature/a").title == "A"
+        assert registry.get("feature/a").status == "active"
+
+
+def test_registry_transaction_writes_once(tmp_path):
+    """Test changes inside a transaction are written in a single save."""
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        registry = TicketRegistry()
+
+        with patch.object(registry, "_write", wraps=registry._write) as mock_write:
+            with registry.transaction():
+                registry.add(create_ticket("feature/a", "A", "/tmp/a", tmux_session="ccc-a"))
+                ticket = registry.get("feature/a")
+                ticket.status = "complete"
+                registry.update(ticket)
+
+        assert mock_write.call_count == 1
+        assert TicketRegistry().get("feature/a").status == "complete"
+        assert [p.name for p in tmp_path.iterdir()] == ["tickets.json"]
+
+
+def test_registry_list_by_status_skips_other_tickets(tmp_path):
+    """Test a cold list_by_status only builds Tickets for matching rows."""
+    with patch("ccc.ticket.get_ccc_home", return_value=tmp_path):
+        writer = TicketRegistry()
+        with writer.transaction():
+            for name, status in (("a", "active"), ("b", "complete"), ("c", "active")):
+                ticket = create_ticket(f"feature/{name}", name, f"/tmp/{name}", tmux_session=f"ccc-{name}")
+                ticket.status = status
+                writer.add(ticket)
+
+        registry = TicketRegistry()
+        with patch("ccc.ticket.Ticket.from_dict", wraps=Ticket.from_dict) as mock_from_dict:
+            active = registry.list_active()
+
+        assert [t.branch for t in active] == ["feature/a", "feature/c"]
+        assert mock_from_dict.call_count == 2
+        assert [t.branch for t in registry.list_by_status("complete")] == ["feature/b"]
@@ -2,11 +2,13 @@
 Tests for todo list management
 """
 
+import os
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from ccc.todo import (
     TodoItem,
@@ -22,6 +24,7 @@ from ccc.todo import (
     get_todos_file_path,
     save_todos,
     load_todos,
+    _todo_cache,
 )
 
 
@@ -78,6 +81,18 @@ class TestTodoItem:
         assert data["assigned_agent"] == "agent-1"
         assert data["completed_at"] == "2025-01-01T12:00:00+00:00"
 
+    def test_todo_item_to_dict_omits_unset_fields(self):
+        """Test that None-valued optional fields are left out and round-trip."""
+        item = TodoItem(id=1, description="Write tests", status="not_started")
+
+        data = item.to_dict()
+
+        assert set(data) == {"id", "description", "status", "created_at"}
+        restored = TodoItem.from_dict(data)
+        assert restored.assigned_agent is None
+        assert restored.blocked_by is None
+        assert restored.completed_at is None
+
     def test_todo_item_from_dict(self):
         """Test creating TodoItem from dictionary."""
         data = {
@@ -125,6 +140,7 @@ class TestTodoList:
 
         # 2 out of 4 done = 50%
         assert todo_list.progress_percentage() == 50.0
+        assert todo_list.progress_percentage(todo_list.progress_stats()) == 50.0
 
     def test_progress_stats(self):
         """Test detailed progress statistics."""
@@ -261,6 +277,25 @@ class TestTodoList:
         # Non-existent task
         assert todo_list.move_item(999, 1) is False
 
+    def test_index_tracks_moves_and_deletes(self):
+        """Test that lookups and next IDs stay correct as the list changes."""
+        items = [
+            TodoItem(id=i, description=f"Task {i}", status="not_started")
+            for i in range(1, 5)
+        ]
+        todo_list = TodoList(branch_name="feature/test", items=items)
+
+        todo_list.move_item(4, 1)
+        todo_list.delete_item(2)
+
+        for position, item in enumerate(todo_list.items):
+            assert todo_list.get_item_index(item.id) == position
+            assert todo_list.get_item(item.id) is item
+        assert todo_list.get_item(2) is None
+
+        todo_list.delete_item(4)
+        assert todo_list.next_task_id() == 4
+
     def test_validate_dependency(self):
         """Test dependency validation."""
         items = [
@@ -493,3 +528,71 @@ class TestTodoStorage:
 
         assert path.name == "todos.yaml"
         assert "feature" in str(path) or "test" in str(path)
+
+    def test_load_todos_reuses_cache(self, temp_ccc_home):
+        """Unchanged files are not re-parsed, and callers get independent copies."""
+        add_todo("feature/test", "Task 1")
+
+        with patch("ccc.todo.yaml.load") as mock_load:
+            first = load_todos("feature/test")
+            first.items[0].description = "Mutated"
+            second = load_todos("feature/test")
+
+        mock_load.assert_not_called()
+        assert second.items[0].description == "Task 1"
+
+    def test_load_todos_sees_external_changes(self, temp_ccc_home):
+        """Rewriting the file outside save_todos invalidates the cache."""
+        add_todo("feature/test", "Task 1")
+        load_todos("feature/test")
+
+        path = get_todos_file_path("feature/test")
+        path.write_text(path.read_text().replace("Task 1", "Task one, edited"))
+
+        assert load_todos("feature/test").items[0].description == "Task one, edited"
+
+    def test_load_todos_prefers_fresh_sidecar(self, temp_ccc_home):
+        """A snapshot written by save_todos is read instead of the YAML."""
+        add_todo("feature/test", "Task 1")
+        _todo_cache.clear()
+
+        with patch("ccc.todo.yaml.load") as mock_load:
+            loaded = load_todos("feature/test")
+
+        mock_load.assert_not_called()
+        assert loaded.items[0].description == "Task 1"
+        assert isinstance(loaded.items[0].created_at, datetime)
+
+    def test_load_todos_ignores_stale_sidecar(self, temp_ccc_home):
+        """Hand-edits to the YAML win over an older snapshot."""
+        add_todo("feature/test", "Task 1")
+        _todo_cache.clear()
+
+        path = get_todos_file_path("feature/test")
+        path.write_text(path.read_text().replace("Task 1", "Edited"))
+        sidecar = path.with_name(path.name + ".cache.json")
+        mtime_ns = path.stat().st_mtime_ns
+        os.utime(sidecar, ns=(mtime_ns - 1_000_000_000, mtime_ns - 1_000_000_000))
+
+        assert load_todos("feature/test").items[0].description == "Edited"
+
+    def test_load_todos_ignores_sidecar_with_same_mtime(self, temp_ccc_home):
+        """A YAML edit that keeps its mtime still invalidates the snapshot."""
+        add_todo("feature/test", "Task 1")
+        _todo_cache.clear()
+
+        path = get_todos_file_path("feature/test")
+        st = path.stat()
+        path.write_text(path.read_text().replace("Task 1", "Edited task"))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert load_todos("feature/test").items[0].description == "Edited task"
+
+    def test_save_todos_leaves_no_temp_files(self, temp_ccc_home):
+        """Saves replace the file atomically without leaving temp files behind."""
+        add_todo("feature/test", "Task 1")
+        add_todo("feature/test", "Task 2")
+
+        path = get_todos_file_path("feature/test")
+        assert not list(path.parent.glob(".tmp-todos-*"))
+        assert len(load_todos("feature/test").items) == 2
@@ -3,15 +3,19 @@ Unit tests for utils module.
 """
 
 import pytest
+import os
+import stat
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from ccc.utils import (
+    atomic_write_bytes,
     get_ccc_home,
     get_branch_dir,
     # validate_ticket_id,  # TODO: Function not implemented yet
     format_time_ago,
+    parse_iso_datetime,
     expand_path,
     # get_tmux_session_name,  # TODO: Function not implemented (exists as get_tmux_session_name_from_branch)
     # get_branch_name,  # TODO: Function not implemented yet
@@ -131,6 +135,13 @@ class TestTimeFormatting:
         # Should handle it by adding UTC timezone
         assert "ago" in result
 
+    def test_parse_iso_datetime_is_memoized(self):
+        """Test parsing the same timestamp twice returns the cached datetime."""
+        first = parse_iso_datetime("2025-11-10T12:00:00+00:00")
+
+        assert first == datetime(2025, 11, 10, 12, 0, tzinfo=timezone.utc)
+        assert parse_iso_datetime("2025-11-10T12:00:00+00:00") is first
+
 
 class TestPathExpansion:
     """Tests for path expansion."""
@@ -252,3 +263,49 @@ class TestStringManipulation:
 
         assert result == "He..."
         assert len(result) == 5
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write_bytes."""
+
+    def test_atomic_write_replaces_contents(self, tmp_path):
+        """Test the file is replaced without leaving temp files behind."""
+        target = tmp_path / "data.json"
+        target.write_bytes(b"old")
+
+        atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_atomic_write_keeps_existing_mode(self, tmp_path):
+        """Test an existing file keeps its permissions instead of mkstemp's 0600."""
+        target = tmp_path / "todos.yaml"
+        target.write_bytes(b"old")
+        os.chmod(target, 0o644)
+
+        atomic_write_bytes(target, b"new")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    def test_atomic_write_new_file_uses_umask(self, tmp_path):
+        """Test a new file gets the usual umask-based mode."""
+        target = tmp_path / "tickets.json"
+        umask = os.umask(0)
+        os.umask(umask)
+
+        atomic_write_bytes(target, b"{}")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+
+    def test_atomic_write_cleans_up_on_failure(self, tmp_path):
+        """Test a failed rename leaves the original file and no temp file."""
+        target = tmp_path / "data.json"
+        target.write_bytes(b"old")
+
+        with patch("ccc.utils.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]